@@ -1,20 +1,17 @@
 import streamlit as st
-from utils.resume_parser import ResumeParser
-from utils.ats_scorer import ATSScorer
-from utils.job_predictor import JobRolePredictor
+from utils.analysis_jobs import file_key, get_default_runner
+from utils.job_predictor import get_default_predictor
 from utils.resume_improver import ResumeImprover
+from utils.nlp_models import load_nlp
 import json
+import time
+from collections import OrderedDict
 
-import os
-import subprocess
+# Analysis jobs kept per session; the least recently viewed file is dropped first
+MAX_SESSION_JOBS = 3
 
-# Auto-download spaCy model if missing
-try:
-    import spacy
-    nlp = spacy.load('en_core_web_sm')
-except OSError:
-    subprocess.run(['python', '-m', 'spacy', 'download', 'en_core_web_sm'])
-    nlp = spacy.load('en_core_web_sm')
+# Warm the shared spaCy pipeline (downloads the model on first run)
+load_nlp()
 
 # Set page config must be first
 st.set_page_config(
@@ -33,19 +30,186 @@ st.set_page_config(
 st.set_page_config(page_title="Resume Analyzer", page_icon="📄", layout="wide")
 
 # Initialize
-parser = ResumeParser()
-scorer = ATSScorer()
-predictor = JobRolePredictor()
 improver = ResumeImprover()
 
-# Cache model training
-@st.cache_resource
-def get_trained_predictor():
-    pred = JobRolePredictor()
-    pred.train()
-    return pred
+# Prebuilt model artifact, loaded once per process (trains only if it is missing)
+predictor = get_default_predictor()
+
+# Background analysis pool shared by every session
+runner = get_default_runner()
+
+
+def render_ats(job):
+    """ATS score, job match and feedback"""
+    ats_result = job.get('ats')
+    score = ats_result['score']
+
+    # Display ATS Score
+    st.subheader("🎯 ATS Compatibility Score")
+    color = "green" if score >= 75 else "orange" if score >= 50 else "red"
+    st.markdown(f"<h1 style='color:{color};'>{score}/100</h1>", unsafe_allow_html=True)
+    st.markdown(f"**Rating:** {ats_result['rating']}")
+
+    # Job Match
+    if job.job_description:
+        st.metric("Job Match", f"{ats_result['job_match']}%")
+
+        missing_keywords = job.wait('missing_keywords')
+        if missing_keywords:
+            st.warning(f"**Missing Keywords:** {', '.join(missing_keywords[:8])}")
+
+    # Feedback
+    st.subheader("💡 Suggestions")
+    for feedback in ats_result['feedback']:
+        if '❌' in feedback:
+            st.error(feedback)
+        elif '⚠️' in feedback:
+            st.warning(feedback)
+        else:
+            st.success(feedback)
+
+
+def render_extracted_info(job):
+    """Contact, education, experience and skills"""
+    parsed_data = job.get('parsed')
+
+    # Extracted Information
+    st.subheader("📝 Extracted Information")
+
+    with st.expander("👤 Contact Information"):
+        st.json(parsed_data['contact_info'])
+
+    if parsed_data.get('education'):
+        with st.expander("🎓 Education"):
+            for edu in parsed_data['education']:
+                st.write(f"**{edu['degree']}** ({edu['year']})")
+                if edu.get('institution') != 'N/A':
+                    st.write(f"📍 {edu['institution']}")
+                st.divider()
+
+    if parsed_data['experience']['details']:
+        with st.expander("💼 Work Experience"):
+            st.metric("Total Experience", f"{parsed_data['experience']['total_years']} years")
+            for exp in parsed_data['experience']['details'][:5]:
+                st.write(f"**{exp['title']}**")
+                if exp.get('company') != 'N/A':
+                    st.write(f"🏢 {exp['company']}")
+                if exp.get('duration') != 'N/A':
+                    st.write(f"📅 {exp['duration']}")
+                st.divider()
+
+    with st.expander("💻 Skills"):
+        if parsed_data['skills']['technical']:
+            st.write("**Technical Skills:**")
+            st.write(", ".join(parsed_data['skills']['technical']))
+
+        if parsed_data['skills']['soft']:
+            st.write("\n**Soft Skills:**")
+            st.write(", ".join(parsed_data['skills']['soft']))
+
+        st.metric("Total Skills Found", parsed_data['skills']['total_count'])
+
+
+def render_role_prediction(job):
+    """Job role prediction"""
+    prediction = job.get('role')
+
+    # Job Role Prediction
+    with st.expander("🎯 Predicted Job Roles"):
+        st.success(f"**Best Match:** {prediction['predicted_role']}")
+        st.metric("Confidence", f"{prediction['confidence']:.1f}%")
+        st.write("**Other Suitable Roles:**")
+        for role, conf in prediction['top_3_roles'][1:]:
+            st.write(f"- {role}: {conf:.1f}%")
+
+
+def render_improvement_plan(job):
+    """Detailed improvement plan"""
+    suggestions = job.get('improvement')
+
+    # Detailed Improvement Plan
+    with st.expander("🔧 Detailed Improvement Plan"):
+        if suggestions['critical']:
+            st.error("🚨 **CRITICAL ISSUES** (Fix Immediately)")
+            for sug in suggestions['critical']:
+                st.write(f"**{sug['issue']}**")
+                st.write(f"→ {sug['suggestion']}")
+                st.info(f"Example: {sug['example']}")
+                st.divider()
+
+        if suggestions['important']:
+            st.warning("⚠️ **IMPORTANT** (High Priority)")
+            for sug in suggestions['important']:
+                st.write(f"**{sug['issue']}**")
+                st.write(f"→ {sug['suggestion']}")
+                st.info(f"Example: {sug['example']}")
+                st.divider()
+
+        if suggestions['nice_to_have']:
+            st.info("💡 **NICE TO HAVE** (When Time Permits)")
+            for sug in suggestions['nice_to_have']:
+                st.write(f"**{sug['issue']}**")
+                st.write(f"→ {sug['suggestion']}")
+                st.caption(f"Example: {sug['example']}")
+                st.divider()
+
+        # Download improvement plan
+        improvement_plan = improver.generate_improvement_plan(suggestions)
+        st.download_button(
+            label="📥 Download Improvement Plan",
+            data=improvement_plan,
+            file_name="resume_improvement_plan.txt",
+            mime="text/plain"
+        )
+
+
+def render_export(job):
+    """JSON and text report downloads once every stage has finished"""
+    parsed_data = job.get('parsed')
+    ats_result = job.get('ats')
+    prediction = job.get('role')
+
+    # Export Section
+    st.subheader("📥 Export Results")
+    col_json, col_txt = st.columns(2)
+
+    with col_json:
+        st.download_button(
+            label="Download JSON",
+            data=json.dumps(parsed_data, indent=2),
+            file_name="resume_analysis.json",
+            mime="application/json"
+        )
+
+    with col_txt:
+        report = f"""
+RESUME ANALYSIS REPORT
+{'=' * 50}
+
+ATS Score: {ats_result['score']}/100
+Rating: {ats_result['rating']}
+
+Contact Information:
+- Name: {parsed_data['contact_info']['name']}
+- Email: {parsed_data['contact_info']['email']}
+- Phone: {parsed_data['contact_info']['phone']}
+
+Skills Found: {parsed_data['skills']['total_count']}
+Technical: {', '.join(parsed_data['skills']['technical'][:10])}
+Soft: {', '.join(parsed_data['skills']['soft'])}
+
+Predicted Role: {prediction['predicted_role']}
+Confidence: {prediction['confidence']:.1f}%
+
+Total Experience: {parsed_data['experience']['total_years']} years
+"""
+        st.download_button(
+            label="Download Report",
+            data=report,
+            file_name="resume_report.txt",
+            mime="text/plain"
+        )
 
-predictor = get_trained_predictor()
 
 # Title
 st.title("📄 AI Resume Analyzer & Job Matcher")
@@ -99,175 +263,47 @@ st.markdown("---")
 st.header("📊 Analysis Results")
 
 if uploaded_file is not None:
-    try:
-        # Extract text
-        with st.spinner(f"Extracting text from {uploaded_file.name}..."):
-            resume_text = parser.extract_text_from_uploaded_file(uploaded_file)
-
-        if resume_text:
-            # Parse resume
-            with st.spinner("Analyzing resume..."):
-                parsed_data = parser.parse_resume(resume_text)
-
-            # ATS Score
-            ats_result = scorer.calculate_ats_score(resume_text, job_description)
-            score = ats_result['score']
-
-            # Display ATS Score
-            st.subheader("🎯 ATS Compatibility Score")
-            color = "green" if score >= 75 else "orange" if score >= 50 else "red"
-            st.markdown(f"<h1 style='color:{color};'>{score}/100</h1>", unsafe_allow_html=True)
-            st.markdown(f"**Rating:** {ats_result['rating']}")
-
-            # Job Match
-            if job_description:
-                job_match = scorer.calculate_job_match(resume_text, job_description)
-                st.metric("Job Match", f"{job_match}%")
-
-                missing_keywords = scorer.find_missing_keywords(resume_text, job_description)
-                if missing_keywords:
-                    st.warning(f"**Missing Keywords:** {', '.join(missing_keywords[:8])}")
-
-            # Feedback
-            st.subheader("💡 Suggestions")
-            for feedback in ats_result['feedback']:
-                if '❌' in feedback:
-                    st.error(feedback)
-                elif '⚠️' in feedback:
-                    st.warning(feedback)
-                else:
-                    st.success(feedback)
-
-            # Extracted Information
-            st.subheader("📝 Extracted Information")
-
-            with st.expander("👤 Contact Information"):
-                st.json(parsed_data['contact_info'])
-
-            if parsed_data.get('education'):
-                with st.expander("🎓 Education"):
-                    for edu in parsed_data['education']:
-                        st.write(f"**{edu['degree']}** ({edu['year']})")
-                        if edu.get('institution') != 'N/A':
-                            st.write(f"📍 {edu['institution']}")
-                        st.divider()
-
-            if parsed_data['experience']['details']:
-                with st.expander("💼 Work Experience"):
-                    st.metric("Total Experience", f"{parsed_data['experience']['total_years']} years")
-                    for exp in parsed_data['experience']['details'][:5]:
-                        st.write(f"**{exp['title']}**")
-                        if exp.get('company') != 'N/A':
-                            st.write(f"🏢 {exp['company']}")
-                        if exp.get('duration') != 'N/A':
-                            st.write(f"📅 {exp['duration']}")
-                        st.divider()
-
-            with st.expander("💻 Skills"):
-                if parsed_data['skills']['technical']:
-                    st.write("**Technical Skills:**")
-                    st.write(", ".join(parsed_data['skills']['technical']))
-
-                if parsed_data['skills']['soft']:
-                    st.write("\n**Soft Skills:**")
-                    st.write(", ".join(parsed_data['skills']['soft']))
-
-                st.metric("Total Skills Found", parsed_data['skills']['total_count'])
-
-            # Job Role Prediction
-            with st.expander("🎯 Predicted Job Roles"):
-                with st.spinner("Predicting suitable roles..."):
-                    prediction = predictor.predict(resume_text)
-                st.success(f"**Best Match:** {prediction['predicted_role']}")
-                st.metric("Confidence", f"{prediction['confidence']:.1f}%")
-                st.write("**Other Suitable Roles:**")
-                for role, conf in prediction['top_3_roles'][1:]:
-                    st.write(f"- {role}: {conf:.1f}%")
-
-            # Detailed Improvement Plan
-            with st.expander("🔧 Detailed Improvement Plan"):
-                suggestions = improver.analyze_and_suggest(parsed_data, resume_text)
-
-                if suggestions['critical']:
-                    st.error("🚨 **CRITICAL ISSUES** (Fix Immediately)")
-                    for sug in suggestions['critical']:
-                        st.write(f"**{sug['issue']}**")
-                        st.write(f"→ {sug['suggestion']}")
-                        st.info(f"Example: {sug['example']}")
-                        st.divider()
-
-                if suggestions['important']:
-                    st.warning("⚠️ **IMPORTANT** (High Priority)")
-                    for sug in suggestions['important']:
-                        st.write(f"**{sug['issue']}**")
-                        st.write(f"→ {sug['suggestion']}")
-                        st.info(f"Example: {sug['example']}")
-                        st.divider()
-
-                if suggestions['nice_to_have']:
-                    st.info("💡 **NICE TO HAVE** (When Time Permits)")
-                    for sug in suggestions['nice_to_have']:
-                        st.write(f"**{sug['issue']}**")
-                        st.write(f"→ {sug['suggestion']}")
-                        st.caption(f"Example: {sug['example']}")
-                        st.divider()
-
-                # Download improvement plan
-                improvement_plan = improver.generate_improvement_plan(suggestions)
-                st.download_button(
-                    label="📥 Download Improvement Plan",
-                    data=improvement_plan,
-                    file_name="resume_improvement_plan.txt",
-                    mime="text/plain"
-                )
-
-            # Export Section
-            st.subheader("📥 Export Results")
-            col_json, col_txt = st.columns(2)
-
-            with col_json:
-                st.download_button(
-                    label="Download JSON",
-                    data=json.dumps(parsed_data, indent=2),
-                    file_name="resume_analysis.json",
-                    mime="application/json"
-                )
-
-            with col_txt:
-                report = f"""
-RESUME ANALYSIS REPORT
-{'=' * 50}
-
-ATS Score: {score}/100
-Rating: {ats_result['rating']}
-
-Contact Information:
-- Name: {parsed_data['contact_info']['name']}
-- Email: {parsed_data['contact_info']['email']}
-- Phone: {parsed_data['contact_info']['phone']}
-
-Skills Found: {parsed_data['skills']['total_count']}
-Technical: {', '.join(parsed_data['skills']['technical'][:10])}
-Soft: {', '.join(parsed_data['skills']['soft'])}
-
-Predicted Role: {prediction['predicted_role']}
-Confidence: {prediction['confidence']:.1f}%
-
-Total Experience: {parsed_data['experience']['total_years']} years
-"""
-                st.download_button(
-                    label="Download Report",
-                    data=report,
-                    file_name="resume_report.txt",
-                    mime="text/plain"
-                )
-
-        else:
-            st.error("❌ Could not extract text from the file. Please check the format.")
-
-    except Exception as e:
-        st.error(f"❌ Error processing file: {str(e)}")
+    # Analysis runs in the background and is kept per file across reruns, so
+    # editing the job description only recomputes the job-match stages
+    jobs = st.session_state.setdefault('analysis_jobs', OrderedDict())
+    data = uploaded_file.getvalue()
+    key = file_key(data)
+    job = jobs.get(key)
+    if job is None:
+        job = jobs[key] = runner.submit(uploaded_file.name, data, job_description)
+    jobs.move_to_end(key)
+    while len(jobs) > MAX_SESSION_JOBS:
+        jobs.popitem(last=False)
+    job.set_job_description(job_description)
+
+    # Each section gets a placeholder now and is filled in as its stage completes
+    sections = [
+        ('ats', st.empty(), render_ats, "⏳ Calculating ATS score..."),
+        ('parsed', st.empty(), render_extracted_info, "⏳ Extracting information..."),
+        ('role', st.empty(), render_role_prediction, "⏳ Predicting suitable roles..."),
+        ('improvement', st.empty(), render_improvement_plan, "⏳ Building improvement plan..."),
+    ]
+    for stage, slot, render, message in sections:
+        slot.info(message)
+
+    pending = list(sections)
+    while pending and job.error is None:
+        for section in list(pending):
+            stage, slot, render, message = section
+            if job.is_done(stage) and job.error is None:
+                with slot.container():
+                    render(job)
+                pending.remove(section)
+        if pending:
+            time.sleep(0.05)
+
+    if job.error is not None:
+        for stage, slot, render, message in pending:
+            slot.empty()
+        st.error(f"❌ Error processing file: {job.error}")
         st.info("Please make sure the file is not corrupted and is in a supported format.")
+    else:
+        render_export(job)
 
 else:
     st.info("👆 Upload a resume to get started!")
@@ -0,0 +1,79 @@
+"""
+Benchmark for ResumeComparator.compare_resumes on a large applicant pool
+Ranks synthetic parsed resumes with and without a job description, for the full
+ranking and for a top-k shortlist. Exits with status 1 when any run takes longer
+than --max-seconds.
+
+Run from the project root:
+    python -m benchmarks.bench_comparator [--applicants N] [--max-seconds S]
+"""
+import argparse
+import random
+import sys
+import time
+
+from utils.resume_comparator import ResumeComparator
+
+TECHNICAL = ['python', 'java', 'sql', 'aws', 'docker', 'kubernetes', 'react', 'tensorflow', 'git', 'linux']
+SOFT = ['leadership', 'communication', 'teamwork', 'problem solving']
+JOB_DESCRIPTION = "Backend engineer with Python, SQL, Docker and AWS experience. Strong communication skills."
+
+
+def synthetic_resume(i, rng):
+    """One resumes_data entry with random skills, experience and contact details"""
+    technical = rng.sample(TECHNICAL, rng.randint(0, len(TECHNICAL)))
+    soft = rng.sample(SOFT, rng.randint(0, len(SOFT)))
+    return {
+        'name': f"applicant_{i}.pdf",
+        'text': f"Software engineer. Skills: {', '.join(technical + soft)}",
+        'parsed_data': {
+            'contact_info': {
+                'email': f"applicant{i}@example.com" if rng.random() < 0.9 else None,
+                'phone': '555-0100' if rng.random() < 0.8 else None,
+                'links': {
+                    'linkedin': 'linkedin.com/in/x' if rng.random() < 0.5 else None,
+                    'github': 'github.com/x' if rng.random() < 0.3 else None,
+                },
+            },
+            'skills': {'technical': technical, 'soft': soft, 'total_count': len(technical) + len(soft)},
+            'experience': {'details': [{}] * rng.randint(0, 5), 'total_years': round(rng.uniform(0, 15), 1)},
+            'education': [{}] * rng.randint(0, 2),
+        },
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--applicants', type=int, default=5000)
+    arg_parser.add_argument('--max-seconds', type=float, default=1.0,
+                            help="allowed wall-clock time per ranking")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    resumes_data = [synthetic_resume(i, rng) for i in range(args.applicants)]
+    comparator = ResumeComparator()
+
+    runs = {
+        'full ranking': lambda: comparator.compare_resumes(resumes_data),
+        'top 20': lambda: comparator.compare_resumes(resumes_data, top_k=20),
+        'full ranking + JD': lambda: comparator.compare_resumes(resumes_data, JOB_DESCRIPTION),
+        'top 20 + JD': lambda: comparator.compare_resumes(resumes_data, JOB_DESCRIPTION, top_k=20),
+    }
+
+    failures = []
+    print(f"{args.applicants} applicants")
+    for name, run in runs.items():
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        print(f"{name:<20}{elapsed * 1000:>10.1f}ms")
+        if elapsed > args.max_seconds:
+            failures.append(name)
+
+    if failures:
+        print("Slower than the limit: " + ', '.join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Regression benchmark for ResumeParser.extract_experience on pathological inputs
+Each input is grown from 2 KB to 64 KB; extraction time must grow linearly with
+its length. Exits with status 1 when the time per character at the largest
+size is more than --max-ratio times the time per character at the smallest,
+or when a regression case no longer gives its expected years of experience.
+
+Run from the project root:
+    python -m benchmarks.bench_experience [--max-ratio R]
+"""
+import argparse
+import sys
+import time
+from datetime import date
+
+from utils.resume_parser import ResumeParser
+
+SIZES = [2000, 4000, 8000, 16000, 32000, 64000]
+
+
+def repeat_to(unit, size):
+    """unit repeated until the text is size characters long"""
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+# Name -> builder(size) for inputs that made the old per-keyword regexes backtrack
+PATHOLOGICAL_INPUTS = {
+    # One long line of letters with no title keyword anywhere
+    'letters, no keyword': lambda size: 'EXPERIENCE\n' + repeat_to('lorem ipsum dolor ', size),
+    # Title keywords with no " at ", comma or newline to end a title
+    'keywords, no terminator': lambda size: 'EXPERIENCE\n' + repeat_to('senior engineer ', size),
+    # A single keyword at the very end of a long letter run
+    'keyword at end': lambda size: 'EXPERIENCE\n' + repeat_to('a ', size) + 'developer',
+    # Many well-formed roles, as in a long CV
+    'many roles': lambda size: 'EXPERIENCE\n' + repeat_to(
+        'Software Engineer at Acme Corp\nJan 2019 - Present\n- Built services used by 1000 users\n', size
+    ),
+}
+
+
+# Fixed "today" so Present ranges give stable totals
+TODAY = date(2026, 10, 18)
+
+# Name -> (resume text, expected years of experience at TODAY)
+REGRESSION_CASES = {
+    # All-caps employer and school names must not end their sections, and the
+    # education range must not count as experience
+    'caps names': (
+        "EXPERIENCE\nACME CORPORATION\nSoftware Engineer\nJan 2022 - Present\n"
+        "EDUCATION\nSTATE UNIVERSITY\nB.Tech Computer Science\nAug 2015 - May 2019\n",
+        4.8  # Jan 2022 - Oct 2026
+    ),
+    # Without an experience section, education and project dates still never count
+    'no experience heading': (
+        "Data Analyst at Foo Corp | Mar 2017 - Dec 2019\n"
+        "PROJECTS\nChatbot, Jan 2021 - Mar 2021\nEDUCATION\nAug 2013 - May 2016\n",
+        2.8  # Mar 2017 - Dec 2019
+    ),
+}
+
+
+def time_call(func, text, min_seconds=0.05):
+    """Mean seconds per call, repeating quick calls until min_seconds have passed"""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        func(text)
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--max-ratio', type=float, default=4.0,
+                            help="allowed growth in time per character from smallest to largest input")
+    args = arg_parser.parse_args()
+
+    parser = ResumeParser()
+    failures = []
+    for name, (text, expected) in REGRESSION_CASES.items():
+        years = parser.calculate_experience_years(text, today=TODAY)
+        if years != expected:
+            print(f"{name}: {years} years of experience, expected {expected}")
+            failures.append(name)
+
+    print(f"{'input':<26}" + ''.join(f"{size // 1000:>8}KB" for size in SIZES) + f"{'ratio':>8}")
+    for name, build in PATHOLOGICAL_INPUTS.items():
+        seconds = [time_call(parser.extract_experience, build(size)) for size in SIZES]
+        ratio = (seconds[-1] / SIZES[-1]) / (seconds[0] / SIZES[0])
+        print(f"{name:<26}" + ''.join(f"{s * 1000:>8.2f}ms" for s in seconds) + f"{ratio:>8.2f}")
+        if ratio > args.max_ratio:
+            failures.append(name)
+
+    if failures:
+        print("Failed: " + ', '.join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for the regex-based extractors
+Times every ResumeParser / ATSScorer extractor on the sample resume and on a
+long resume built by repeating it, and prints the mean time per call.
+
+Run from the project root:
+    python -m benchmarks.bench_extractors [--repeat N]
+"""
+import argparse
+import os
+import timeit
+
+from utils.ats_scorer import ATSScorer
+from utils.resume_parser import ResumeParser
+from utils.text_extractor import TextExtractor
+
+SAMPLE_PATH = os.path.join('data', 'sample_resumes', 'test_resume.txt')
+JOB_DESCRIPTION = (
+    "Software Developer position requiring Python, React, and Node.js experience. "
+    "Must have experience with machine learning and MongoDB. "
+    "Strong communication and leadership skills required."
+)
+
+
+def build_inputs():
+    """Sample resume as is, and the same resume repeated to about 30 KB"""
+    with open(SAMPLE_PATH, 'r', encoding='utf-8') as f:
+        sample = f.read()
+    extractor = TextExtractor()
+    return {
+        'sample': extractor.clean_text(sample),
+        'long': extractor.clean_text('\n'.join([sample] * max(1, 30000 // len(sample)))),
+    }
+
+
+def extractors():
+    """Name -> callable(text) for every extractor being measured"""
+    parser = ResumeParser()
+    scorer = ATSScorer()
+    return {
+        'extract_email': parser.extract_email,
+        'extract_phone': parser.extract_phone,
+        'extract_links': parser.extract_links,
+        'extract_education': parser.extract_education,
+        'extract_experience': parser.extract_experience,
+        'calculate_experience_years': parser.calculate_experience_years,
+        'ats_contact_and_metrics': lambda text: scorer.calculate_ats_score(text),
+        'find_missing_keywords': lambda text: scorer.find_missing_keywords(text, JOB_DESCRIPTION),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--repeat', type=int, default=200, help="calls per measurement")
+    args = arg_parser.parse_args()
+
+    inputs = build_inputs()
+    print(f"{'extractor':<28}" + ''.join(f"{name + ' (ms)':>14}" for name in inputs))
+    for name, func in extractors().items():
+        row = f"{name:<28}"
+        for text in inputs.values():
+            # Best of three runs keeps noise from other processes out of the numbers
+            best = min(timeit.repeat(lambda: func(text), number=args.repeat, repeat=3))
+            row += f"{best / args.repeat * 1000:>14.3f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
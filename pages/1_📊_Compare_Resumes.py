@@ -1,6 +1,7 @@
 import streamlit as st
 from utils.resume_parser import ResumeParser
 from utils.resume_comparator import ResumeComparator
+from utils.job_predictor import get_default_predictor
 import pandas as pd
 
 st.set_page_config(page_title="Compare Resumes", page_icon="📊", layout="wide")
@@ -11,6 +12,7 @@ st.markdown("Upload multiple resumes to compare and rank them")
 # Initialize
 parser = ResumeParser()
 comparator = ResumeComparator()
+predictor = get_default_predictor()
 
 # File uploader for multiple files
 uploaded_files = st.file_uploader(
@@ -22,27 +24,66 @@ uploaded_files = st.file_uploader(
 if uploaded_files and len(uploaded_files) > 1:
     st.success(f"✅ {len(uploaded_files)} resumes uploaded")
     
+    job_description = st.text_area(
+        "Job Description (optional)",
+        height=150,
+        placeholder="Paste a job description to rank resumes by how well they match it..."
+    )
+    
+    count_once = st.checkbox(
+        "Count near-duplicate resumes once",
+        value=True,
+        help="Resumes that are almost identical (e.g. the same candidate submitted twice) are ranked by their best copy only"
+    )
+    
     if st.button("🔍 Compare Resumes", type="primary"):
         with st.spinner("Analyzing all resumes..."):
             resumes_data = []
             
-            # Process each resume
-            for file in uploaded_files:
-                try:
-                    text = parser.extract_text_from_uploaded_file(file)
-                    parsed = parser.parse_resume(text)
-                    
-                    resumes_data.append({
-                        'name': file.name,
-                        'text': text,
-                        'parsed_data': parsed
-                    })
-                except Exception as e:
-                    st.error(f"Error processing {file.name}: {str(e)}")
+            # Process all resumes in one batch (cached uploads return instantly), in upload order
+            results = parser.parse_many(uploaded_files, return_text=True)
+            for file, (text, parsed) in zip(uploaded_files, results):
+                if parsed is None:
+                    st.error(f"Error processing {file.name}: could not extract text")
+                    continue
+                
+                resumes_data.append({
+                    'name': file.name,
+                    'text': text,
+                    'parsed_data': parsed
+                })
             
             # Compare resumes
             if len(resumes_data) > 1:
-                comparisons = comparator.compare_resumes(resumes_data)
+                comparisons = comparator.compare_resumes(resumes_data, job_description)
+                
+                # Near-duplicate groups found by the comparator (MinHash/LSH over the resume text)
+                duplicate_groups = {}
+                for comp in comparisons:
+                    if comp['cluster_size'] > 1:
+                        duplicate_groups.setdefault(comp['cluster_id'], []).append(comp['name'])
+                
+                if duplicate_groups:
+                    extra_copies = sum(len(names) - 1 for names in duplicate_groups.values())
+                    st.warning(f"⚠️ {extra_copies} resume(s) look like near-duplicates of another upload")
+                    with st.expander("View duplicate groups"):
+                        for cluster_id, names in duplicate_groups.items():
+                            st.markdown(f"**Group {cluster_id}:** " + ", ".join(names))
+                
+                if count_once:
+                    # Comparisons are sorted by score, so the first copy seen is the best one
+                    seen_clusters = set()
+                    unique_comparisons = []
+                    for comp in comparisons:
+                        if comp['cluster_id'] not in seen_clusters:
+                            seen_clusters.add(comp['cluster_id'])
+                            unique_comparisons.append(comp)
+                    comparisons = unique_comparisons
+                
+                # Predict roles for the whole batch in one call
+                predictions = predictor.predict_many([r['text'] for r in resumes_data], top_k=1)
+                for comp in comparisons:
+                    comp['predicted_role'] = predictions[comp['index']]['predicted_role']
                 
                 st.subheader("🏆 Rankings")
                 
@@ -54,6 +95,7 @@ if uploaded_files and len(uploaded_files) > 1:
                 st.dataframe(
                     df,
                     column_config={
+                        "index": None,
                         "name": "Resume Name",
                         "score": st.column_config.ProgressColumn(
                             "Overall Score",
@@ -61,9 +103,18 @@ if uploaded_files and len(uploaded_files) > 1:
                             min_value=0,
                             max_value=100,
                         ),
+                        "jd_match": st.column_config.ProgressColumn(
+                            "Job Match",
+                            format="%.1f%%",
+                            min_value=0,
+                            max_value=100,
+                        ),
                         "skills": "Skills Count",
                         "experience": "Experience (Years)",
                         "education": "Education Count",
+                        "predicted_role": "Predicted Role",
+                        "cluster_id": "Duplicate Group",
+                        "cluster_size": "Copies",
                         "completeness": st.column_config.ProgressColumn(
                             "Profile Completeness",
                             format="%d%%",
@@ -1,11 +1,12 @@
 import streamlit as st
 from utils.resume_parser import ResumeParser
 from utils.ats_scorer import ATSScorer
+from utils.history_store import get_history_store
+from utils.history_aggregates import summarize
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
-import os
 
 st.set_page_config(page_title="Analytics Dashboard", page_icon="📈", layout="wide")
 
@@ -16,23 +17,8 @@ st.markdown("Track your resume improvement over time")
 parser = ResumeParser()
 scorer = ATSScorer()
 
-# Create analytics directory if it doesn't exist
-if not os.path.exists('analytics_data'):
-    os.makedirs('analytics_data')
-
-# Load saved analyses
-def load_history():
-    history_file = 'analytics_data/history.json'
-    if os.path.exists(history_file):
-        with open(history_file, 'r') as f:
-            return json.load(f)
-    return []
-
-def save_analysis(data):
-    history = load_history()
-    history.append(data)
-    with open('analytics_data/history.json', 'w') as f:
-        json.dump(history, f, indent=2)
+# Append-only history (SQLite); imports an old analytics_data/history.json once
+store = get_history_store()
 
 # Sidebar - Upload new resume
 with st.sidebar:
@@ -59,45 +45,48 @@ with st.sidebar:
                     'has_linkedin': bool(parsed['contact_info']['links']['linkedin']),
                     'has_github': bool(parsed['contact_info']['links']['github']),
                     'education_count': len(parsed.get('education', [])),
-                    'experience_count': len(parsed['experience']['details'])
+                    'experience_count': len(parsed['experience']['details']),
+                    'skills': parsed['skills']['technical'] + parsed['skills']['soft']
                 }
                 
-                save_analysis(analysis_data)
+                store.append(analysis_data)
                 st.success(f"✅ Analysis saved: {version_name}")
                 st.rerun()
             except Exception as e:
                 st.error(f"Error: {str(e)}")
 
-# Main dashboard
-history = load_history()
+# Main dashboard: metrics come from running aggregates, charts from a bounded window
+summary = store.summary()
 
-if history:
+if summary:
     st.subheader("📊 Your Progress Overview")
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
-    latest = history[-1]
+    first = summary['first']
+    latest = summary['latest']
+    has_previous = summary['count'] > 1
     
     with col1:
         st.metric(
             "Latest ATS Score",
             f"{latest['ats_score']}/100",
-            delta=f"{latest['ats_score'] - history[0]['ats_score']}" if len(history) > 1 else None
+            delta=f"{latest['ats_score'] - first['ats_score']}" if has_previous else None
         )
     
     with col2:
         st.metric(
             "Skills Count",
             latest['skills_count'],
-            delta=f"{latest['skills_count'] - history[0]['skills_count']}" if len(history) > 1 else None
+            delta=f"{latest['skills_count'] - first['skills_count']}" if has_previous else None
         )
     
     with col3:
         st.metric(
             "Experience",
             f"{latest['experience_years']} years",
-            delta=f"{latest['experience_years'] - history[0]['experience_years']}" if len(history) > 1 else None
+            delta=f"{latest['experience_years'] - first['experience_years']}" if has_previous else None
         )
     
     with col4:
@@ -109,6 +98,30 @@ if history:
         ]) * 25
         st.metric("Profile Completeness", f"{completeness}%")
     
+    st.caption(
+        f"{summary['count']} analyses saved | ATS score average {summary['ats_mean']:.1f}, "
+        f"best {summary['ats_max']}, lowest {summary['ats_min']}"
+    )
+    
+    # Only the selected window of history is loaded for charts and the table
+    window = st.radio("Show", ["Last 20", "Last 100", "Last 30 days", "All"], horizontal=True)
+    if window == "Last 30 days":
+        history = store.query(since=(datetime.now() - timedelta(days=30)).isoformat())
+    elif window == "All":
+        history = store.query()
+    else:
+        history = store.query(limit=int(window.split()[1]))
+    if not history:
+        st.caption("No analyses in the last 30 days; showing the latest 20 instead.")
+        history = store.query(limit=20)
+    
+    # Same statistics as the caption above, over the selected window only
+    window_summary = summarize(history)
+    st.caption(
+        f"Showing {window_summary['count']} analyses | ATS score average {window_summary['ats_mean']:.1f}, "
+        f"best {window_summary['ats_max']}, lowest {window_summary['ats_min']}"
+    )
+    
     # Progress over time
     st.subheader("📈 ATS Score Progress")
     
@@ -163,6 +176,37 @@ if history:
         fig3.update_layout(xaxis_title="Version", yaxis_title="Completeness %", height=300)
         st.plotly_chart(fig3, use_container_width=True)
     
+    # Daily trend and skills from the precomputed aggregates
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📅 Daily ATS Score (Last 30 Days)")
+        daily = store.daily(since=(datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))
+        fig4 = go.Figure(data=[
+            go.Scatter(
+                x=[d['day'] for d in daily],
+                y=[d['ats_mean'] for d in daily],
+                mode='lines+markers',
+                text=[f"{d['count']} analyses, {d['ats_min']}-{d['ats_max']}" for d in daily],
+                hovertemplate='%{x}<br>Average: %{y:.1f}<br>%{text}<extra></extra>'
+            )
+        ])
+        fig4.update_layout(xaxis_title="Day", yaxis_title="Average ATS Score", yaxis=dict(range=[0, 100]), height=300)
+        st.plotly_chart(fig4, use_container_width=True)
+    
+    with col2:
+        st.subheader("🛠️ Most Frequent Skills")
+        top_skills = store.top_skills(10)
+        if top_skills:
+            fig5 = go.Figure(data=[
+                go.Bar(x=[count for _, count in top_skills], y=[skill for skill, _ in top_skills],
+                       orientation='h', marker_color='orange')
+            ])
+            fig5.update_layout(xaxis_title="Analyses", yaxis=dict(autorange='reversed'), height=300)
+            st.plotly_chart(fig5, use_container_width=True)
+        else:
+            st.info("Save a new analysis to start tracking skills.")
+    
     # Detailed comparison table
     st.subheader("📋 Version Comparison")
     
@@ -188,9 +232,9 @@ if history:
     # Insights
     st.subheader("💡 Insights & Recommendations")
     
-    if len(history) > 1:
-        score_improvement = latest['ats_score'] - history[0]['ats_score']
-        skills_improvement = latest['skills_count'] - history[0]['skills_count']
+    if has_previous:
+        score_improvement = latest['ats_score'] - first['ats_score']
+        skills_improvement = latest['skills_count'] - first['skills_count']
         
         if score_improvement > 0:
             st.success(f"🎉 Great job! Your ATS score improved by {score_improvement} points!")
@@ -219,7 +263,7 @@ if history:
     
     with col1:
         st.download_button(
-            label="Download History (JSON)",
+            label="Download Shown History (JSON)",
             data=json.dumps(history, indent=2),
             file_name="resume_history.json",
             mime="application/json"
@@ -227,10 +271,9 @@ if history:
     
     with col2:
         if st.button("🗑️ Clear History", type="secondary"):
-            if os.path.exists('analytics_data/history.json'):
-                os.remove('analytics_data/history.json')
-                st.success("History cleared!")
-                st.rerun()
+            store.clear()
+            st.success("History cleared!")
+            st.rerun()
 
 else:
     st.info("👆 Upload your first resume to start tracking your progress!")
@@ -1,10 +1,13 @@
 import streamlit as st
 from utils.resume_parser import ResumeParser
 from utils.ats_scorer import ATSScorer
+from utils.job_predictor import get_default_predictor
+from utils.feature_table import FeatureTable
+from utils.dedupe import find_duplicates, first_of_clusters, duplicate_summary
 import plotly.graph_objects as go
 import plotly.express as px
-from collections import Counter
 import pandas as pd
+import numpy as np
 
 st.set_page_config(page_title="Advanced Analytics", page_icon="📉", layout="wide")
 
@@ -14,6 +17,7 @@ st.markdown("Deep dive into resume patterns and trends")
 # Initialize
 parser = ResumeParser()
 scorer = ATSScorer()
+predictor = get_default_predictor()
 
 # Upload multiple resumes for analytics
 uploaded_files = st.file_uploader(
@@ -25,42 +29,57 @@ uploaded_files = st.file_uploader(
 
 if uploaded_files and len(uploaded_files) >= 3:
     
+    count_once = st.checkbox(
+        "Count near-duplicate resumes once",
+        value=True,
+        help="Resumes that are almost identical (e.g. the same candidate submitted twice) only count once in the statistics"
+    )
+    
     if st.button("🔍 Analyze Patterns", type="primary"):
         with st.spinner("Analyzing resumes..."):
             
-            all_skills = []
+            all_parsed = []
             all_scores = []
-            all_experience = []
-            all_education = []
-            contact_completeness = []
-            
-            for file in uploaded_files:
-                try:
-                    text = parser.extract_text_from_uploaded_file(file)
-                    if text:
-                        parsed = parser.parse_resume(text)
-                        ats_result = scorer.calculate_ats_score(text)
-                        
-                        # Collect data
-                        all_skills.extend(parsed['skills']['technical'])
-                        all_scores.append(ats_result['score'])
-                        all_experience.append(parsed['experience']['total_years'])
-                        all_education.append(len(parsed.get('education', [])))
-                        
-                        # Contact completeness
-                        completeness = sum([
-                            bool(parsed['contact_info']['email']),
-                            bool(parsed['contact_info']['phone']),
-                            bool(parsed['contact_info']['links']['linkedin']),
-                            bool(parsed['contact_info']['links']['github'])
-                        ]) * 25
-                        contact_completeness.append(completeness)
+            all_texts = []
+            
+            # Process all resumes in one batch (cached uploads return instantly), in upload order
+            results = parser.parse_many(uploaded_files, return_text=True)
+            for file, (text, parsed) in zip(uploaded_files, results):
+                if parsed is None:
+                    st.error(f"Error processing {file.name}: could not extract text")
+                    continue
+                
+                ats_result = scorer.calculate_ats_score(text)
                 
-                except Exception as e:
-                    st.error(f"Error processing {file.name}: {str(e)}")
+                # Collect data
+                all_texts.append(text)
+                all_parsed.append(parsed)
+                all_scores.append(ats_result['score'])
+            
+            # Near-duplicate clusters (MinHash/LSH), so resubmitted candidates do not skew the statistics
+            cluster_ids = find_duplicates(all_texts)
+            duplicates = duplicate_summary(cluster_ids)
+            if count_once and duplicates['duplicates']:
+                keep = first_of_clusters(cluster_ids)
+                all_texts = [text for text, kept in zip(all_texts, keep) if kept]
+                all_parsed = [parsed for parsed, kept in zip(all_parsed, keep) if kept]
+                all_scores = [score for score, kept in zip(all_scores, keep) if kept]
+            
+            # Columnar features; every statistic below is a vectorized column operation
+            table = FeatureTable(all_parsed, all_scores)
+            if not table.size:
+                st.error("None of the uploaded resumes could be read")
+                st.stop()
+            stats = table.summary()
             
             # Display analytics
-            st.success(f"✅ Analyzed {len(uploaded_files)} resumes")
+            st.success(f"✅ Analyzed {table.size} resumes")
+            if duplicates['duplicates']:
+                action = "counted once" if count_once else "included in the statistics"
+                st.info(
+                    f"🔁 Found {duplicates['duplicates']} near-duplicate resume(s) in "
+                    f"{duplicates['duplicate_clusters']} group(s); {action}"
+                )
             
             # Key Metrics
             st.subheader("📊 Key Statistics")
@@ -68,16 +87,16 @@ if uploaded_files and len(uploaded_files) >= 3:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("Avg ATS Score", f"{sum(all_scores)/len(all_scores):.1f}/100")
+                st.metric("Avg ATS Score", f"{stats['avg_ats_score']:.1f}/100")
             
             with col2:
-                st.metric("Avg Experience", f"{sum(all_experience)/len(all_experience):.1f} yrs")
+                st.metric("Avg Experience", f"{stats['avg_experience']:.1f} yrs")
             
             with col3:
-                st.metric("Avg Skills", f"{len(all_skills)/len(uploaded_files):.1f}")
+                st.metric("Avg Skills", f"{stats['avg_technical_skills']:.1f}")
             
             with col4:
-                st.metric("Avg Completeness", f"{sum(contact_completeness)/len(contact_completeness):.0f}%")
+                st.metric("Avg Completeness", f"{stats['avg_completeness']:.0f}%")
             
             # Charts
             st.divider()
@@ -85,8 +104,7 @@ if uploaded_files and len(uploaded_files) >= 3:
             # Top Skills
             st.subheader("🔥 Most In-Demand Skills")
             
-            skill_counts = Counter(all_skills)
-            top_skills = skill_counts.most_common(15)
+            top_skills = table.top_skills(15)
             
             if top_skills:
                 skills_df = pd.DataFrame(top_skills, columns=['Skill', 'Count'])
@@ -111,7 +129,7 @@ if uploaded_files and len(uploaded_files) >= 3:
                 
                 fig2 = go.Figure()
                 fig2.add_trace(go.Histogram(
-                    x=all_scores,
+                    x=table.ats_score,
                     nbinsx=10,
                     marker_color='lightblue',
                     name='ATS Scores'
@@ -128,22 +146,30 @@ if uploaded_files and len(uploaded_files) >= 3:
                 
                 fig3 = go.Figure()
                 fig3.add_trace(go.Box(
-                    y=all_experience,
+                    y=table.experience_years,
                     name='Experience Years',
                     marker_color='lightgreen'
                 ))
                 fig3.update_layout(yaxis_title="Years of Experience")
                 st.plotly_chart(fig3, use_container_width=True)
             
+            # Role distribution: one batched prediction for every resume
+            st.subheader("🎯 Predicted Role Distribution")
+            
+            predictions = predictor.predict_many(all_texts, top_k=1)
+            roles, role_counts = np.unique([p['predicted_role'] for p in predictions], return_counts=True)
+            role_distribution = dict(zip(roles.tolist(), role_counts.tolist()))
+            
+            fig_roles = go.Figure(data=[
+                go.Pie(labels=list(role_distribution.keys()), values=list(role_distribution.values()), hole=.3)
+            ])
+            fig_roles.update_layout(title="Best-Matching Role per Resume")
+            st.plotly_chart(fig_roles, use_container_width=True)
+            
             # Contact Completeness
             st.subheader("📞 Profile Completeness Analysis")
             
-            completeness_ranges = {
-                '0-25%': sum(1 for c in contact_completeness if c <= 25),
-                '26-50%': sum(1 for c in contact_completeness if 25 < c <= 50),
-                '51-75%': sum(1 for c in contact_completeness if 50 < c <= 75),
-                '76-100%': sum(1 for c in contact_completeness if c > 75)
-            }
+            completeness_ranges = table.completeness_distribution()
             
             fig4 = go.Figure(data=[
                 go.Pie(
@@ -163,21 +189,22 @@ if uploaded_files and len(uploaded_files) >= 3:
             
             with col1:
                 st.markdown("**Strengths:**")
-                avg_score = sum(all_scores)/len(all_scores)
+                avg_score = stats['avg_ats_score']
+                unique_skills = table.unique_skills()
                 if avg_score >= 70:
                     st.success("✅ Good overall ATS scores")
-                if len(set(all_skills)) > 20:
-                    st.success(f"✅ Diverse skill set ({len(set(all_skills))} unique skills)")
-                if sum(all_experience)/len(all_experience) >= 2:
+                if unique_skills > 20:
+                    st.success(f"✅ Diverse skill set ({unique_skills} unique skills)")
+                if stats['avg_experience'] >= 2:
                     st.success("✅ Experienced candidate pool")
             
             with col2:
                 st.markdown("**Areas for Improvement:**")
                 if avg_score < 70:
                     st.warning("⚠️ ATS scores need improvement")
-                if sum(contact_completeness)/len(contact_completeness) < 75:
+                if stats['avg_completeness'] < 75:
                     st.warning("⚠️ Incomplete contact information")
-                if len(set(all_skills)) < 15:
+                if unique_skills < 15:
                     st.warning("⚠️ Limited skill diversity")
             
             # Recommendations
@@ -185,7 +212,7 @@ if uploaded_files and len(uploaded_files) >= 3:
             st.subheader("🎯 Recommendations")
             
             st.markdown(f"""
-            Based on analysis of {len(uploaded_files)} resumes:
+            Based on analysis of {table.size} resumes:
             
             1. **Most Common Skills**: {', '.join([s[0] for s in top_skills[:5]])}
             2. **Target ATS Score**: Aim for 75+ (current avg: {avg_score:.1f})
@@ -197,11 +224,13 @@ if uploaded_files and len(uploaded_files) >= 3:
             st.divider()
             
             analytics_data = {
-                'total_resumes': len(uploaded_files),
-                'avg_ats_score': sum(all_scores)/len(all_scores),
-                'avg_experience': sum(all_experience)/len(all_experience),
+                'total_resumes': table.size,
+                'avg_ats_score': stats['avg_ats_score'],
+                'avg_experience': stats['avg_experience'],
                 'top_skills': dict(top_skills[:10]),
-                'avg_completeness': sum(contact_completeness)/len(contact_completeness)
+                'role_distribution': role_distribution,
+                'avg_completeness': stats['avg_completeness'],
+                'duplicates': duplicates
             }
             
             import json
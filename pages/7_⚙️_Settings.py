@@ -1,6 +1,7 @@
 import streamlit as st
 import json
 import os
+from utils.history_store import get_history_store
 
 st.set_page_config(page_title="Settings", page_icon="⚙️", layout="wide")
 
@@ -185,9 +186,8 @@ with tab4:
     
     with col2:
         if st.button("🗑️ Clear Analytics History"):
-            if os.path.exists('analytics_data/history.json'):
-                os.remove('analytics_data/history.json')
-                st.success("✅ Analytics history cleared!")
+            get_history_store().clear()
+            st.success("✅ Analytics history cleared!")
 
 # Display current settings
 st.divider()
@@ -5,3 +5,6 @@ python -m spacy download en_core_web_sm
 
 # Download NLTK data
 python -c "import nltk; nltk.download('punkt'); nltk.download('stopwords'); nltk.download('wordnet')"
+
+# Build the job role prediction model artifact
+python -m utils.job_predictor
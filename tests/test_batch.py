@@ -0,0 +1,39 @@
+import json
+
+import pytest
+from docx import Document
+
+from utils import batch
+from utils.resume_parser import ResumeParser
+
+RESUME = """Jane Roe
+jane.roe@email.com | +1-555-123-4567
+EXPERIENCE
+Software Engineer, Acme Corp
+Jan 2019 - Dec 2021
+Built Python and React services.
+SKILLS
+Python, React, SQL"""
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_score_reports_missing_file_and_keeps_going(tmp_path, monkeypatch, jobs):
+    resume = tmp_path / 'jane.docx'
+    document = Document()
+    for line in RESUME.splitlines():
+        document.add_paragraph(line)
+    document.save(resume)
+    missing = tmp_path / 'gone.docx'
+    # The file disappears between listing the directory and reading it
+    monkeypatch.setattr(batch, 'find_resumes', lambda directory: [missing, resume])
+    # Use the worker pool even for two files
+    monkeypatch.setattr(ResumeParser, 'PARALLEL_MIN_FILES', 1)
+    out = tmp_path / 'results.jsonl'
+
+    assert batch.main(['score', '--in', str(tmp_path), '--out', str(out), '-j', str(jobs)]) == 0
+
+    results = [json.loads(line) for line in out.read_text(encoding='utf-8').splitlines()]
+    assert [result['file'] for result in results] == [str(missing), str(resume)]
+    assert 'No such file' in results[0]['error']
+    assert 'error' not in results[1]
+    assert results[1]['email'] == 'jane.roe@email.com'
@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+from utils.date_spans import DateSpanIndex, month_index
+from utils.resume_parser import ResumeParser
+
+TODAY = date(2026, 10, 18)
+
+
+@pytest.mark.parametrize('text, first, last', [
+    ("Mar 2017 - Dec 2019", (2017, 3), (2019, 12)),
+    ("March 2018 to Present", (2018, 3), (2026, 10)),
+    ("2015 - 2018", (2015, 1), (2018, 12)),
+    ("2019 – Present", (2019, 1), (2026, 10)),
+    ("01/2018 - 03/2021", (2018, 1), (2021, 3)),
+    ("5/2020 - present", (2020, 5), (2026, 10)),
+    ("Jan 2015 - 2018", (2015, 1), (2018, 12)),
+    ("2016 - 06/2019", (2016, 1), (2019, 6)),
+])
+def test_date_range_forms(text, first, last):
+    spans = DateSpanIndex("Engineer | " + text, today=TODAY).spans
+    assert [(span[1], span[2], span[3]) for span in spans] == [(text, month_index(*first), month_index(*last))]
+
+
+@pytest.mark.parametrize('text', [
+    "Born 12/03/2018 - 2020",   # day/month/year, not a month/year range
+    "Call +1-555-2015-2018",    # digits of a phone number
+    "2018 - 2015",              # runs backwards
+])
+def test_not_date_ranges(text):
+    assert DateSpanIndex(text, today=TODAY).spans == []
+
+
+def test_experience_years_from_year_only_and_numeric_ranges():
+    text = (
+        "EXPERIENCE\n"
+        "Software Engineer at Acme Corp\n2015 - 2018\n"
+        "Data Analyst at Foo Corp\n01/2019 - 06/2020\n"
+    )
+    assert ResumeParser().calculate_experience_years(text, today=TODAY) == 5.5  # 48 + 18 months
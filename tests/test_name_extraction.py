@@ -0,0 +1,26 @@
+import pytest
+
+from utils.resume_parser import ResumeParser
+
+
+@pytest.mark.parametrize('line', ["John Doe", "Jane R Roe", "Mary-Ann O-Neil"])
+def test_name_fast_path_accepts_names(line):
+    assert ResumeParser()._name_fast_path([line, "jane@email.com"]) == line
+
+
+@pytest.mark.parametrize('line', [
+    "Personal Information",
+    "Technical Lead",
+    "Machine Learning Enthusiast",
+    "Bangalore India",
+    "Hyderabad Telangana",
+    "Professional Summary",
+    "Senior Software Engineer",
+])
+def test_name_fast_path_rejects_headings_titles_skills_and_places(line):
+    assert ResumeParser()._name_fast_path([line, "John Doe"]) is None
+
+
+def test_name_fallback_skips_non_name_lines():
+    lines = ["Personal Information", "Bangalore India", "John Doe"]
+    assert ResumeParser()._name_from_doc(lines, None) == "John Doe"
@@ -0,0 +1,43 @@
+from docx import Document
+
+from utils import resume_parser
+from utils.parse_cache import ParseCache
+from utils.resume_parser import ResumeParser
+
+
+def write_docx(path, lines):
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    document.save(path)
+    return path
+
+
+def test_parse_many_fills_and_reuses_the_parent_cache(tmp_path, monkeypatch):
+    paths = [
+        write_docx(tmp_path / f'resume{i}.docx', ["Jane Roe", "jane.roe@email.com", "SKILLS", "Python, SQL", f"Resume {i}"])
+        for i in range(3)
+    ]
+    monkeypatch.setattr(ResumeParser, 'PARALLEL_MIN_FILES', 1)
+    parser = ResumeParser(cache=ParseCache())
+
+    first = list(parser.parse_many(paths, n_process=2, return_text=True))
+    assert first == list(ResumeParser(cache=ParseCache()).parse_many(paths, return_text=True))
+
+    # Every text is cached now, so no worker pool is started
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker pool started for cached files")
+    monkeypatch.setattr(resume_parser, 'ProcessPoolExecutor', no_pool)
+
+    assert list(parser.parse_many(paths, n_process=2, return_text=True)) == first
+
+
+def test_parse_many_extracts_few_files_in_process(tmp_path, monkeypatch):
+    paths = [write_docx(tmp_path / f'resume{i}.docx', ["Jane Roe", f"Resume {i}"]) for i in range(3)]
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker pool started below PARALLEL_MIN_FILES")
+    monkeypatch.setattr(resume_parser, 'ProcessPoolExecutor', no_pool)
+
+    results = list(ResumeParser(cache=ParseCache()).parse_many(paths, n_process=8))
+    assert [parsed['contact_info']['name'] for parsed in results] == ["Jane Roe"] * 3
@@ -0,0 +1,47 @@
+import pytest
+
+from utils.resume_features import ResumeFeatures
+from utils.section_index import SectionIndex
+
+
+@pytest.mark.parametrize('heading, sections', [
+    ("Relevant Experience", ['experience']),
+    ("Internship Experience", ['experience']),
+    ("Education & Training", ['education']),
+    ("EDUCATION AND CERTIFICATIONS", ['education', 'certifications']),
+    ("SKILLS & TOOLS", ['skills']),
+    ("Skills Summary", ['skills']),
+    ("PROJECTS & ACHIEVEMENTS:", ['projects', 'achievements']),
+])
+def test_compound_headings(heading, sections):
+    index = SectionIndex(f"Jane Roe\n{heading}\nSome content\nREFERENCES\nOn request\n")
+    assert list(index.spans) == sections
+    for section in sections:
+        assert index.section_text(section) == "Some content"
+
+
+def test_compound_heading_with_inline_content():
+    index = SectionIndex("Jane Roe\nSkills & Tools: Python, Git\nEDUCATION\nB.Tech\n")
+    assert index.section_text('skills') == "Python, Git"
+    assert index.section_text('education') == "B.Tech"
+
+
+@pytest.mark.parametrize('line', [
+    "Customer Experience Manager",
+    "Skills Development Intern",
+    "Experience with Python",
+    "ACME CORPORATION",
+    "Jane Roe",
+])
+def test_lines_that_are_not_headings(line):
+    index = SectionIndex(f"EXPERIENCE\n{line}\nJan 2020 - Present\n")
+    assert list(index.spans) == ['experience']
+    assert index.section_text('experience') == f"{line}\nJan 2020 - Present"
+
+
+def test_compound_headings_count_towards_ats_sections():
+    text = (
+        "Jane Roe\nRelevant Experience\nBuilt APIs\nEducation & Training\nB.Tech\n"
+        "SKILLS & TOOLS\nPython\nPROJECTS & ACHIEVEMENTS\nChatbot\n"
+    )
+    assert ResumeFeatures(text).sections == {'education', 'experience', 'skills', 'projects'}
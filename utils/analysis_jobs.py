@@ -0,0 +1,155 @@
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from utils.ats_scorer import ATSScorer, get_job_matcher
+from utils.job_predictor import get_default_predictor
+from utils.resume_improver import ResumeImprover
+from utils.resume_parser import ResumeParser
+from utils.stage_graph import StageGraph
+
+# Stages that only depend on the uploaded file
+RESUME_STAGES = ['text', 'features', 'parsed', 'ats_base', 'role', 'improvement']
+# Stages recomputed when the job description changes
+JD_STAGES = ['jd_vector', 'job_match', 'missing_keywords', 'ats']
+
+
+def file_key(data):
+    """Content hash identifying an uploaded file"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_analysis_graph(parser, scorer, improver, get_predictor):
+    """
+    StageGraph of a single resume analysis
+    Inputs: 'upload' as (file name, bytes) and 'job_description'
+    text -> features -> parsed, features -> ats_base, text -> role, parsed -> improvement;
+    job_description -> jd_vector -> job_match / missing_keywords -> ats
+    """
+    graph = StageGraph()
+    graph.add_input('upload')
+    graph.add_input('job_description', "")
+
+    graph.add_stage('text', lambda upload: parser.extract_text_from_bytes(*upload), ['upload'])
+    graph.add_stage('features', parser.extract_features, ['text'])
+    graph.add_stage('parsed', lambda text, features: parser.parse_resume(text, features=features),
+                    ['text', 'features'])
+    graph.add_stage('ats_base', scorer.score_base, ['features'])
+    graph.add_stage('role', lambda text: get_predictor().predict(text), ['text'])
+    graph.add_stage('improvement', improver.analyze_and_suggest, ['parsed', 'text', 'features'])
+
+    graph.add_stage('jd_vector', lambda jd: get_job_matcher(jd) if jd else None, ['job_description'])
+    graph.add_stage(
+        'job_match',
+        lambda matcher, features: matcher.score(features.text_lower, lowercased=True) if matcher else None,
+        ['jd_vector', 'features']
+    )
+    graph.add_stage(
+        'missing_keywords',
+        lambda jd, text, features: scorer.find_missing_keywords(text, jd, features) if jd else [],
+        ['job_description', 'text', 'features']
+    )
+    graph.add_stage('ats', scorer.apply_job_match, ['ats_base', 'job_match'])
+    return graph
+
+
+class AnalysisJob:
+    """
+    Background analysis of one uploaded resume, evaluated on a StageGraph
+    Stage results appear as soon as each stage finishes; use get() to poll
+    and wait() to block. Changing the job description only reruns JD_STAGES.
+    """
+
+    def __init__(self, runner, file_name, data, job_description=""):
+        self.runner = runner
+        self.file_name = file_name
+        self.key = file_key(data)
+        self.job_description = job_description
+        self.error = None
+        self._error_lock = threading.Lock()
+
+        self.graph = build_analysis_graph(runner.parser, runner.scorer, runner.improver, runner.get_predictor)
+        self.graph.set('upload', (file_name, data))
+        self.graph.set('job_description', job_description)
+
+    def start(self):
+        """Queue every stage on the runner's pool"""
+        self._submit(['text', 'role'])
+        self._submit(['text', 'ats', 'missing_keywords', 'improvement'])
+        return self
+
+    def set_job_description(self, job_description):
+        """Switch to another job description, rerunning only the JD-dependent stages"""
+        if job_description == self.job_description:
+            return
+        self.job_description = job_description
+        self.graph.set('job_description', job_description)
+        self._submit(['ats', 'missing_keywords'])
+
+    def get(self, stage):
+        """Result of a stage if it is up to date, else None"""
+        return self.graph.peek(stage)
+
+    def is_done(self, stage):
+        """True once a stage is up to date (or the job has failed)"""
+        return self.error is not None or self.graph.is_current(stage)
+
+    def wait(self, stage):
+        """Block until a stage is up to date and return its result (None on failure)"""
+        if self.error is not None:
+            return None
+        try:
+            return self.graph.get(stage)
+        except Exception as e:
+            self._fail(str(e))
+            return None
+
+    def _submit(self, stages):
+        self.runner.executor.submit(self._evaluate, stages)
+
+    def _evaluate(self, stages):
+        """Bring stages up to date in order; the graph computes each node once"""
+        for stage in stages:
+            if self.error is not None:
+                return
+            try:
+                value = self.graph.get(stage)
+            except Exception as e:
+                self._fail(str(e))
+                return
+            if stage == 'text' and not value:
+                self._fail("Could not extract text from the file")
+                return
+
+    def _fail(self, message):
+        """Record the error so pollers stop waiting"""
+        with self._error_lock:
+            if self.error is not None:
+                return
+            self.error = message
+        print(f"Analysis of {self.file_name} failed: {message}")
+
+
+class AnalysisRunner:
+    """Thread pool that runs AnalysisJobs with shared parser, scorer and predictor"""
+
+    def __init__(self, max_workers=4, parser=None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='analysis')
+        self.parser = parser or ResumeParser()
+        self.scorer = ATSScorer()
+        self.improver = ResumeImprover()
+
+    def get_predictor(self):
+        """Shared job role predictor (loaded on first use)"""
+        return get_default_predictor()
+
+    def submit(self, file_name, data, job_description=""):
+        """Start analysing an uploaded file in the background"""
+        return AnalysisJob(self, file_name, data, job_description).start()
+
+
+@lru_cache(maxsize=1)
+def get_default_runner():
+    """Process-wide runner shared by every session"""
+    return AnalysisRunner()
@@ -1,45 +1,127 @@
-import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from functools import lru_cache
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from utils import patterns
+from utils.resume_features import ResumeFeatures, SECTION_KEYWORDS
+
+# Smoothed idf TfidfVectorizer assigns, on a resume + job description corpus,
+# to a term found in only one of the two documents (terms in both get 1.0)
+ONE_SIDED_IDF = np.log(3 / 2) + 1
+
+
+class JobMatcher:
+    """Score many resumes against one job description in a single vectorized pass"""
+    
+    def __init__(self, job_description):
+        self.job_description = job_description
+        
+        # Vectorize the job description once
+        vectorizer = CountVectorizer()
+        try:
+            jd_counts = vectorizer.fit_transform([job_description]).toarray()[0].astype(float)
+        except ValueError:
+            # No usable terms: every resume scores 0
+            self.vocabulary = {}
+            return
+        
+        self.vocabulary = vectorizer.vocabulary_
+        self.jd_counts = jd_counts
+        self.jd_sq_total = float(np.square(jd_counts).sum())
+    
+    def score_many(self, resume_texts, lowercased=False):
+        """
+        Return an array of match percentages, one per resume
+        Equal to fitting TfidfVectorizer on each (resume, job description) pair and
+        taking their cosine similarity, without refitting per resume.
+        Pass lowercased=True when the texts are already lowercase.
+        """
+        scores = np.zeros(len(resume_texts))
+        if not self.vocabulary or not resume_texts:
+            return scores
+        
+        try:
+            vectorizer = CountVectorizer(lowercase=not lowercased)
+            counts = vectorizer.fit_transform(resume_texts).astype(float).tocsc()
+        except ValueError:
+            return scores
+        
+        # Terms shared by the resume batch and the job description
+        shared = [(col, self.vocabulary[term]) for term, col in vectorizer.vocabulary_.items()
+                  if term in self.vocabulary]
+        resume_cols = [col for col, _ in shared]
+        jd_cols = [col for _, col in shared]
+        
+        shared_counts = counts[:, resume_cols].tocsr()
+        jd_shared = self.jd_counts[jd_cols]
+        
+        # Shared terms weigh 1.0, one-sided terms ONE_SIDED_IDF, per resume/JD pair
+        dot = shared_counts @ jd_shared
+        resume_sq_shared = np.asarray(shared_counts.multiply(shared_counts).sum(axis=1)).ravel()
+        resume_sq_total = np.asarray(counts.multiply(counts).sum(axis=1)).ravel()
+        jd_sq_shared = (shared_counts > 0) @ np.square(jd_shared)
+        
+        one_sided = ONE_SIDED_IDF ** 2
+        resume_norm = resume_sq_shared + one_sided * (resume_sq_total - resume_sq_shared)
+        jd_norm = jd_sq_shared + one_sided * (self.jd_sq_total - jd_sq_shared)
+        denominator = np.sqrt(resume_norm * jd_norm)
+        
+        np.divide(dot, denominator, out=scores, where=denominator > 0)
+        return np.round(scores * 100, 2)
+    
+    def score(self, resume_text, lowercased=False):
+        """Return the match percentage of a single resume"""
+        return float(self.score_many([resume_text], lowercased)[0])
+
+
+@lru_cache(maxsize=32)
+def get_job_matcher(job_description):
+    """Shared JobMatcher per job description, so it is vectorized only once"""
+    return JobMatcher(job_description)
+
 
 class ATSScorer:
     """Calculate ATS score and match resume with job description"""
     
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer()
-    
     def calculate_ats_score(self, resume_text, job_description=""):
         """Calculate ATS compatibility score (0-100)"""
+        features = ResumeFeatures(resume_text)
+        base = self.score_base(features)
+        match_score = self.calculate_job_match(resume_text, job_description) if job_description else None
+        return self.apply_job_match(base, match_score)
+    
+    def score_base(self, features):
+        """
+        Job-description independent part of the ATS score: contact info, sections,
+        formatting, length and achievements (80 points)
+        """
         score = 0
         feedback = []
         
         # 1. Check for contact info (20 points)
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_text):
+        if features.ats_email:
             score += 10
         else:
             feedback.append("❌ Add email address")
         
-        if re.search(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]', resume_text):
+        if features.ats_phone:
             score += 10
         else:
             feedback.append("❌ Add phone number")
         
         # 2. Check for section headers (20 points)
-        sections = ['education', 'experience', 'skills', 'projects']
-        found_sections = sum(1 for s in sections if s in resume_text.lower())
-        score += (found_sections / len(sections)) * 20
+        found_sections = len(features.sections)
+        score += (found_sections / len(SECTION_KEYWORDS)) * 20
         
-        if found_sections < len(sections):
-            missing = [s for s in sections if s not in resume_text.lower()]
+        if found_sections < len(SECTION_KEYWORDS):
+            missing = [s for s in SECTION_KEYWORDS if s not in features.sections]
             feedback.append(f"❌ Add sections: {', '.join(missing)}")
         
         # 3. Check formatting (15 points)
-        lines = resume_text.split('\n')
-        if len(lines) > 10:  # Reasonable length
+        if features.line_count > 10:  # Reasonable length
             score += 5
         
         # Check for bullet points
-        if '•' in resume_text or '-' in resume_text:
+        if features.has_bullets:
             score += 5
         else:
             feedback.append("❌ Use bullet points for better readability")
@@ -47,13 +129,13 @@ class ATSScorer:
         # Check for action verbs
         action_verbs = ['developed', 'created', 'managed', 'led', 'designed', 
                        'implemented', 'improved', 'achieved']
-        if any(verb in resume_text.lower() for verb in action_verbs):
+        if any(verb in features.text_lower for verb in action_verbs):
             score += 5
         else:
             feedback.append("❌ Use action verbs (developed, created, managed, etc.)")
         
         # 4. Check length (10 points)
-        word_count = len(resume_text.split())
+        word_count = features.word_count
         if 300 <= word_count <= 800:
             score += 10
         elif word_count < 300:
@@ -62,14 +144,20 @@ class ATSScorer:
             feedback.append("⚠️ Resume too long - keep it concise")
         
         # 5. Check for quantifiable achievements (15 points)
-        if re.search(r'\d+%|\d+ users|\d+ projects', resume_text, re.IGNORECASE):
+        if patterns.METRICS.search(features.text_lower):
             score += 15
         else:
             feedback.append("❌ Add quantifiable achievements (numbers, percentages)")
         
+        return {'score': score, 'feedback': feedback}
+    
+    def apply_job_match(self, base, match_score=None):
+        """Add the job description match (20 points) to a base score and finalize it"""
+        score = base['score']
+        feedback = list(base['feedback'])
+        
         # 6. Job description matching (20 points)
-        if job_description:
-            match_score = self.calculate_job_match(resume_text, job_description)
+        if match_score is not None:
             score += match_score * 0.2
             if match_score < 50:
                 feedback.append("❌ Low keyword match with job description")
@@ -82,29 +170,25 @@ class ATSScorer:
         return {
             'score': min(score, 100),  # Cap at 100
             'feedback': feedback,
-            'rating': self._get_rating(score)
+            'rating': self._get_rating(score),
+            'job_match': match_score
         }
     
     def calculate_job_match(self, resume_text, job_description):
         """Calculate similarity between resume and job description"""
-        try:
-            # Create TF-IDF vectors
-            documents = [resume_text.lower(), job_description.lower()]
-            tfidf_matrix = self.vectorizer.fit_transform(documents)
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            
-            # Convert to percentage
-            return round(similarity * 100, 2)
-        except:
-            return 0
+        return get_job_matcher(job_description).score(resume_text)
+    
+    def match_many(self, resume_texts, job_description):
+        """Job match percentages for a batch of resumes against one job description"""
+        return get_job_matcher(job_description).score_many(list(resume_texts))
     
-    def find_missing_keywords(self, resume_text, job_description):
+    def find_missing_keywords(self, resume_text, job_description, features=None):
         """Find keywords in job description missing from resume"""
+        resume_lower = features.text_lower if features is not None else resume_text.lower()
+        
         # Extract important words from job description
-        jd_words = set(re.findall(r'\b[a-z]{4,}\b', job_description.lower()))
-        resume_words = set(re.findall(r'\b[a-z]{4,}\b', resume_text.lower()))
+        jd_words = set(patterns.KEYWORD.findall(job_description.lower()))
+        resume_words = set(patterns.KEYWORD.findall(resume_lower))
         
         # Common words to ignore
         stop_words = {'that', 'with', 'from', 'have', 'this', 'will', 'your', 
@@ -0,0 +1,141 @@
+"""
+Headless batch scoring of a directory of resumes against one job description
+
+    python -m utils.batch score --jd jd.txt --in resumes/ --out results.jsonl -j 8
+
+Writes one JSON line per resume, in sorted file order, as soon as each chunk
+of files has been scored.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+from utils.ats_scorer import ATSScorer
+from utils.job_predictor import get_default_predictor
+from utils.resume_features import ResumeFeatures
+from utils.resume_parser import ResumeParser
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+
+def find_resumes(directory):
+    """Every supported resume file below a directory, in sorted order"""
+    return sorted(
+        path for path in Path(directory).rglob('*')
+        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+    )
+
+
+def score_resumes(paths, job_description, n_process=1, chunk_size=256):
+    """
+    Yield one result dict per resume path, in input order
+    Text extraction runs on n_process worker processes through
+    ResumeParser.parse_many; parsing (batched name NER and the regex
+    extractors), job match and role prediction run in this process, batched
+    per chunk of resumes.
+    """
+    parser = ResumeParser()
+    scorer = ATSScorer()
+    predictor = get_default_predictor()
+
+    parsed_pairs = parser.parse_many(paths, n_process=n_process, return_text=True)
+    paths = iter(paths)
+    while True:
+        chunk = list(islice(parsed_pairs, chunk_size))
+        if not chunk:
+            return
+        chunk_paths = list(islice(paths, len(chunk)))
+
+        readable = [text for text, parsed in chunk if parsed is not None]
+        match_scores = iter(scorer.match_many(readable, job_description) if job_description else [])
+        predictions = iter(predictor.predict_many(readable))
+
+        for path, (text, parsed) in zip(chunk_paths, chunk):
+            if parsed is None:
+                yield {'file': str(path), 'error': _extraction_error(parser, path)}
+                continue
+            yield _result(path, text, parsed, scorer, job_description,
+                          next(match_scores) if job_description else None, next(predictions))
+
+
+def _extraction_error(parser, path):
+    """Reason a resume could not be read, from a second, strict read in this process"""
+    try:
+        parser.read_file(str(path), strict=True)
+    except (OSError, ValueError) as e:
+        return str(e)
+    return "Could not extract text"
+
+
+def _result(path, text, parsed, scorer, job_description, match_score, prediction):
+    """JSON-serialisable summary of one scored resume"""
+    features = ResumeFeatures(text)
+    ats = scorer.apply_job_match(scorer.score_base(features), match_score)
+    contact = parsed['contact_info']
+    return {
+        'file': str(path),
+        'name': contact['name'],
+        'email': contact['email'],
+        'phone': contact['phone'],
+        'ats_score': round(float(ats['score']), 2),
+        'rating': ats['rating'],
+        'job_match': None if match_score is None else float(match_score),
+        'missing_keywords': scorer.find_missing_keywords(text, job_description, features)[:10] if job_description else [],
+        'predicted_role': str(prediction['predicted_role']),
+        'role_confidence': round(float(prediction['confidence']), 2),
+        'top_roles': [[str(role), round(float(confidence), 2)] for role, confidence in prediction['top_roles']],
+        'skills': parsed['skills']['technical'] + parsed['skills']['soft'],
+        'total_years': parsed['experience']['total_years'],
+        'education': [edu['degree'] for edu in parsed['education']],
+    }
+
+
+def run_score(args):
+    """score subcommand"""
+    job_description = ""
+    if args.jd:
+        with open(args.jd, 'r', encoding='utf-8') as f:
+            job_description = f.read()
+
+    paths = find_resumes(args.input)
+    if not paths:
+        print(f"No {', '.join(SUPPORTED_EXTENSIONS)} files found in {args.input}", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    failed = 0
+    with open(args.out, 'w', encoding='utf-8') as out:
+        for count, result in enumerate(score_resumes(paths, job_description, args.jobs, args.chunk_size), 1):
+            failed += 'error' in result
+            out.write(json.dumps(result, ensure_ascii=False) + '\n')
+            out.flush()
+
+    elapsed = time.perf_counter() - started
+    print(f"Scored {count - failed}/{count} resumes in {elapsed:.1f}s -> {args.out}", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog='python -m utils.batch', description="Batch resume screening")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    score = commands.add_parser('score', help="score every resume in a directory")
+    score.add_argument('--jd', help="job description text file (omit to skip job matching)")
+    score.add_argument('--in', dest='input', required=True, help="directory of PDF, DOCX and TXT resumes")
+    score.add_argument('--out', required=True, help="JSON lines output file")
+    score.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                       help="worker processes for text extraction")
+    score.add_argument('--chunk-size', type=int, default=256,
+                       help="resumes scored together per batch")
+    score.set_defaults(handler=run_score)
+
+    args = arg_parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
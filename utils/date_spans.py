@@ -0,0 +1,82 @@
+from bisect import bisect_left
+from datetime import date
+
+from utils import patterns
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+
+def month_index(year, month):
+    """Months since year 0, so consecutive months differ by one"""
+    return year * 12 + month - 1
+
+
+def range_end(match, side, year_month):
+    """month_index of one end of a DATE_RANGE match; a bare year counts as its month year_month"""
+    if match.group(f'{side}_month'):
+        return month_index(int(match.group(f'{side}_year')), MONTHS[match.group(f'{side}_month').lower()])
+    if match.group(f'{side}_mm'):
+        return month_index(int(match.group(f'{side}_mm_year')), int(match.group(f'{side}_mm')))
+    return month_index(int(match.group(f'{side}_yyyy')), year_month)
+
+
+def merge_intervals(intervals):
+    """Merge inclusive (first, last) month intervals that overlap or touch"""
+    merged = []
+    for first, last in sorted(intervals):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1][1] = last
+        else:
+            merged.append([first, last])
+    return [(first, last) for first, last in merged]
+
+
+def total_months(intervals):
+    """Months covered by a set of intervals, counting overlaps once"""
+    return sum(last - first + 1 for first, last in merge_intervals(intervals))
+
+
+class DateSpanIndex:
+    """
+    Every date range ("Mon YYYY", "MM/YYYY" or "YYYY" to one of those or "Present")
+    in part of a document, found in one scan
+    spans: (offset, text, first month, last month) in document order; months are
+           month_index values and both ends are inclusive
+    today: date used for "Present" and to clip ranges that end in the future
+    exclude: (start, end) offset spans whose ranges are skipped, e.g. the education section
+    """
+
+    def __init__(self, text, start=0, end=None, today=None, exclude=()):
+        end = len(text) if end is None else end
+        today = today or date.today()
+        current = month_index(today.year, today.month)
+
+        self.spans = []
+        for match in patterns.DATE_RANGE.finditer(text, start, end):
+            if any(skip_start <= match.start() < skip_end for skip_start, skip_end in exclude):
+                continue
+            # "2015 - 2018" runs from January 2015 through December 2018
+            first = range_end(match, 'start', 1)
+            last = current if match.group('present') else range_end(match, 'end', 12)
+            last = min(last, current)
+
+            # Ranges that run backwards or start in the future are not experience
+            if first > last:
+                continue
+            self.spans.append((match.start(), match.group(), first, last))
+        self.starts = [span[0] for span in self.spans]
+
+    def first_between(self, start, end):
+        """The first span starting in [start, end), or None"""
+        index = bisect_left(self.starts, start)
+        if index < len(self.spans) and self.spans[index][0] < end:
+            return self.spans[index]
+        return None
+
+    def total_months(self):
+        """Months covered by every span, with overlapping roles merged"""
+        return total_months([(first, last) for _, _, first, last in self.spans])
@@ -0,0 +1,211 @@
+import zlib
+from itertools import chain
+
+import numpy as np
+
+from utils import patterns
+
+_EMPTY = np.iinfo(np.uint64).max
+# Odd multiplier that mixes consecutive word hashes into one shingle hash
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+# Shingles hashed per MinHash chunk, bounding memory to chunk x num_perm values
+_CHUNK_SHINGLES = 1 << 12
+
+
+class DuplicateDetector:
+    """
+    Near-duplicate detection for a batch of resume texts with MinHash and LSH
+    Each text becomes a set of word shingles summarised by a num_perm MinHash
+    signature. Signatures are split into bands; texts sharing an identical band
+    are candidate pairs, kept when their estimated Jaccard similarity reaches
+    threshold, and grouped into clusters with union-find. No step compares
+    every pair of texts.
+    threshold: estimated Jaccard similarity of two shingle sets to be duplicates
+    num_perm: MinHash signature length (must be a multiple of bands)
+    bands: LSH bands; more bands find lower-similarity candidates
+    shingle_size: words per shingle
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=16, shingle_size=5, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        # Multiplicative hash functions a * x mod 2^64 with odd a: each permutes the
+        # 64-bit values, so shingles never collide within one hash function
+        self._a = rng.integers(0, _EMPTY, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self._mix = _MIX ** np.arange(1, shingle_size + 1, dtype=np.uint64)
+
+    def signatures(self, texts):
+        """
+        (len(texts), num_perm) uint64 MinHash signatures and a mask of texts with
+        no words (their signature rows are meaningless)
+        """
+        word_hashes, doc_of = self._word_hashes(texts)
+        n = len(texts)
+        shingles, shingle_doc = self._shingles(word_hashes, doc_of, n)
+
+        signatures = np.full((n, self.num_perm), _EMPTY, dtype=np.uint64)
+        if len(shingles):
+            # shingle_doc is sorted, so each document is one run of shingles within a chunk
+            for start in range(0, len(shingles), _CHUNK_SHINGLES):
+                chunk = shingles[start:start + _CHUNK_SHINGLES]
+                docs = shingle_doc[start:start + _CHUNK_SHINGLES]
+                # One row per hash function, so each reduction runs over contiguous memory
+                values = np.multiply.outer(self._a, chunk)
+                firsts = np.flatnonzero(np.r_[True, docs[1:] != docs[:-1]])
+                mins = np.minimum.reduceat(values, firsts, axis=1).T
+                rows = docs[firsts]
+                # A document split across two chunks keeps the smaller of both minimums
+                signatures[rows] = np.minimum(signatures[rows], mins)
+
+        empty = np.bincount(doc_of, minlength=n) == 0
+        return signatures, empty
+
+    def clusters(self, texts):
+        """Cluster id per text; near-duplicates share an id, numbered in order of first appearance"""
+        texts = list(texts)
+        n = len(texts)
+        if not n:
+            return np.zeros(0, dtype=int)
+
+        signatures, empty = self.signatures(texts)
+        # Texts with no words stay in clusters of their own
+        labels = np.arange(n)
+        words = np.flatnonzero(~empty)
+        if len(words):
+            # Identical signatures (exact resubmissions) collapse to one row before banding
+            _, first, inverse = np.unique(_row_keys(signatures[words]), return_index=True, return_inverse=True)
+            distinct = words[first]
+            roots = self._link(signatures[distinct])
+            labels[words] = distinct[roots[inverse.ravel()]]
+
+        # Number clusters by the position of their first text
+        _, first_seen, inverse = np.unique(labels, return_index=True, return_inverse=True)
+        return np.argsort(np.argsort(first_seen))[inverse.ravel()]
+
+    def _link(self, signatures):
+        """Union-find root per signature row, joining rows whose estimated similarity reaches threshold"""
+        parent = list(range(len(signatures)))
+        min_matches = self.threshold * self.num_perm
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i, j):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        for bucket in self._buckets(signatures):
+            # Compare the whole bucket with its first member in one pass
+            matches = np.count_nonzero(signatures[bucket] == signatures[bucket[0]], axis=1)
+            for member in bucket[matches >= min_matches][1:]:
+                union(bucket[0], member)
+            # The rare members unlike the first are matched against a few representatives
+            representatives = [bucket[0]]
+            for member in bucket[matches < min_matches]:
+                scores = np.count_nonzero(signatures[representatives] == signatures[member], axis=1)
+                best = int(scores.argmax())
+                if scores[best] >= min_matches:
+                    union(representatives[best], member)
+                else:
+                    representatives.append(member)
+
+        return np.array([find(i) for i in range(len(signatures))])
+
+    def _word_hashes(self, texts):
+        """32-bit hash of every word of every text, and the text index of each word"""
+        words = [patterns.WORD.findall((text or '').lower()) for text in texts]
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+
+        # Each distinct word is hashed once; crc32 is stable across processes, unlike hash()
+        hashes = {word: zlib.crc32(word.encode('utf-8')) for word in set(chain.from_iterable(words))}
+        word_hashes = np.fromiter(
+            map(hashes.__getitem__, chain.from_iterable(words)), dtype=np.uint64, count=int(lengths.sum())
+        )
+        return word_hashes, np.repeat(np.arange(len(words)), lengths)
+
+    def _shingles(self, word_hashes, doc_of, n):
+        """64-bit hash of every run of shingle_size consecutive words within one text"""
+        k = self.shingle_size
+        lengths = np.bincount(doc_of, minlength=n)
+        if len(word_hashes) >= k:
+            windows = len(word_hashes) - k + 1
+            mixed = np.zeros(windows, dtype=np.uint64)
+            for j in range(k):
+                mixed += word_hashes[j:j + windows] * self._mix[j]
+            # Windows that run across the end of a text are dropped
+            valid = doc_of[:windows] == doc_of[k - 1:]
+            shingles, shingle_doc = mixed[valid], doc_of[:windows][valid]
+        else:
+            shingles, shingle_doc = np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+
+        # Texts shorter than one shingle are a single shingle of all their words
+        short = np.flatnonzero((lengths > 0) & (lengths < k))
+        if len(short):
+            starts = np.r_[0, np.cumsum(lengths)[:-1]]
+            extra = np.array([
+                (word_hashes[starts[i]:starts[i] + lengths[i]] * self._mix[:lengths[i]]).sum()
+                for i in short
+            ], dtype=np.uint64)
+            order = np.argsort(np.r_[shingle_doc, short], kind='stable')
+            shingles = np.r_[shingles, extra][order]
+            shingle_doc = np.r_[shingle_doc, short][order]
+        return shingles, shingle_doc
+
+    def _buckets(self, signatures):
+        """Arrays of row indices that share an identical band of their signatures"""
+        for band in range(self.bands):
+            _, inverse, counts = np.unique(
+                _row_keys(signatures[:, band * self.rows:(band + 1) * self.rows]),
+                return_inverse=True, return_counts=True
+            )
+            inverse = inverse.ravel()
+            members = np.flatnonzero(counts[inverse] > 1)
+            if not len(members):
+                continue
+            order = np.argsort(inverse[members], kind='stable')
+            members, groups = members[order], inverse[members][order]
+            splits = np.flatnonzero(groups[1:] != groups[:-1]) + 1
+            yield from np.split(members, splits)
+
+
+def _row_keys(array):
+    """One opaque, comparable value per row of a 2-D array, for np.unique over rows"""
+    array = np.ascontiguousarray(array)
+    return array.view(np.dtype((np.void, array.dtype.itemsize * array.shape[1]))).ravel()
+
+
+def find_duplicates(texts, threshold=0.8):
+    """Near-duplicate cluster id per text (see DuplicateDetector)"""
+    return DuplicateDetector(threshold=threshold).clusters(texts)
+
+
+def first_of_clusters(cluster_ids):
+    """Boolean mask keeping only the first text of each cluster"""
+    cluster_ids = np.asarray(cluster_ids)
+    keep = np.zeros(len(cluster_ids), dtype=bool)
+    keep[np.unique(cluster_ids, return_index=True)[1]] = True
+    return keep
+
+
+def duplicate_summary(cluster_ids):
+    """Counts of texts, distinct candidates, extra copies and clusters with copies"""
+    cluster_ids = np.asarray(cluster_ids)
+    sizes = np.bincount(cluster_ids) if len(cluster_ids) else np.zeros(0, dtype=int)
+    sizes = sizes[sizes > 0]
+    return {
+        'total': int(len(cluster_ids)),
+        'unique': int(len(sizes)),
+        'duplicates': int(len(cluster_ids) - len(sizes)),
+        'duplicate_clusters': int(np.count_nonzero(sizes > 1)),
+    }
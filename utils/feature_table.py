@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+NUMERIC_COLUMNS = [
+    'ats_score', 'experience_years', 'education_count', 'experience_count',
+    'technical_count', 'soft_count', 'completeness'
+]
+CONTACT_FIELDS = ['has_email', 'has_phone', 'has_linkedin', 'has_github']
+# Upper edges of the profile completeness buckets (the last bucket is open)
+COMPLETENESS_BUCKETS = {'0-25%': 25, '26-50%': 50, '51-75%': 75, '76-100%': None}
+
+
+class FeatureTable:
+    """
+    Columnar features of a batch of parsed resumes
+    Every numeric feature is a NumPy array with one entry per resume, and skills
+    are a sparse resume x skill 0/1 matrix (skill_names gives the columns,
+    skill_categories their 'technical'/'soft' category). Statistics are computed
+    over whole columns instead of per-resume Python loops.
+    """
+
+    def __init__(self, parsed_resumes, ats_scores=None):
+        parsed_resumes = list(parsed_resumes)
+        n = len(parsed_resumes)
+        self.size = n
+
+        def column(values, dtype=float):
+            return np.fromiter(values, dtype=dtype, count=n)
+
+        self.ats_score = column(ats_scores if ats_scores is not None else [np.nan] * n)
+        self.experience_years = column(p['experience']['total_years'] for p in parsed_resumes)
+        self.education_count = column((len(p.get('education', [])) for p in parsed_resumes), int)
+        self.experience_count = column((len(p['experience']['details']) for p in parsed_resumes), int)
+        self.technical_count = column((len(p['skills']['technical']) for p in parsed_resumes), int)
+        self.soft_count = column((len(p['skills']['soft']) for p in parsed_resumes), int)
+
+        self.has_email = column((bool(p['contact_info']['email']) for p in parsed_resumes), bool)
+        self.has_phone = column((bool(p['contact_info']['phone']) for p in parsed_resumes), bool)
+        self.has_linkedin = column((bool(p['contact_info']['links']['linkedin']) for p in parsed_resumes), bool)
+        self.has_github = column((bool(p['contact_info']['links']['github']) for p in parsed_resumes), bool)
+        contacts = np.column_stack([getattr(self, field) for field in CONTACT_FIELDS]) if n else np.zeros((0, 4))
+        self.completeness = contacts.sum(axis=1) * 25
+
+        self._build_skill_matrix(parsed_resumes)
+
+    def _build_skill_matrix(self, parsed_resumes):
+        """CSR matrix with a 1 where a resume lists a skill"""
+        vocabulary = {}
+        categories = []
+        indptr = [0]
+        indices = []
+        for parsed in parsed_resumes:
+            for category in ('technical', 'soft'):
+                for skill in parsed['skills'][category]:
+                    key = (category, skill)
+                    index = vocabulary.get(key)
+                    if index is None:
+                        index = vocabulary[key] = len(vocabulary)
+                        categories.append(category)
+                    indices.append(index)
+            indptr.append(len(indices))
+
+        self.skill_names = np.array([skill for _, skill in vocabulary], dtype=object)
+        self.skill_categories = np.array(categories, dtype=object)
+        self.skill_matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(self.size, len(vocabulary))
+        )
+        # Parsers list each skill once, but sum duplicates defensively
+        self.skill_matrix.sum_duplicates()
+        self.skill_matrix.data[:] = 1
+
+    def to_frame(self):
+        """pandas DataFrame of the numeric and contact columns, one row per resume"""
+        return pd.DataFrame({name: getattr(self, name) for name in NUMERIC_COLUMNS + CONTACT_FIELDS})
+
+    def skill_counts(self, category=None):
+        """(skill names, number of resumes listing each), optionally for one category"""
+        counts = np.asarray(self.skill_matrix.sum(axis=0)).ravel()
+        if category is None:
+            return self.skill_names, counts
+        mask = self.skill_categories == category
+        return self.skill_names[mask], counts[mask]
+
+    def top_skills(self, n=15, category='technical'):
+        """The n most common skills as (skill, count), most common first"""
+        names, counts = self.skill_counts(category)
+        if not len(counts):
+            return []
+        k = min(n, len(counts))
+        top = np.argpartition(-counts, k - 1)[:k]
+        # Ties are broken by skill name so the order is stable
+        top = sorted(top, key=lambda i: (-counts[i], names[i]))
+        return [(names[i], int(counts[i])) for i in top]
+
+    def unique_skills(self, category='technical'):
+        """Number of distinct skills seen in at least one resume"""
+        names, counts = self.skill_counts(category)
+        return int(np.count_nonzero(counts))
+
+    def completeness_distribution(self):
+        """Number of resumes per profile completeness bucket"""
+        edges = [edge for edge in COMPLETENESS_BUCKETS.values() if edge is not None]
+        buckets = np.searchsorted(edges, self.completeness, side='left')
+        counts = np.bincount(buckets, minlength=len(COMPLETENESS_BUCKETS))
+        return dict(zip(COMPLETENESS_BUCKETS, counts.tolist()))
+
+    def summary(self):
+        """Batch averages used by the analytics pages"""
+        if not self.size:
+            return {}
+        return {
+            'total_resumes': self.size,
+            'avg_ats_score': float(np.nanmean(self.ats_score)) if not np.isnan(self.ats_score).all() else None,
+            'avg_experience': float(self.experience_years.mean()),
+            'avg_technical_skills': float(self.technical_count.mean()),
+            'avg_education': float(self.education_count.mean()),
+            'avg_completeness': float(self.completeness.mean()),
+        }
@@ -0,0 +1,113 @@
+import json
+
+
+def day_of(record):
+    """Day bucket (YYYY-MM-DD) of a history record"""
+    return record['timestamp'][:10]
+
+
+def summarize(records):
+    """Summary of a list of records, in the same shape as HistoryAggregates.summary()"""
+    summary = None
+    for record in records:
+        summary = _add_to_summary(summary, record)
+    return _finish_summary(summary)
+
+
+def _add_to_summary(summary, record):
+    score = record['ats_score']
+    if summary is None:
+        return {'count': 1, 'first': record, 'latest': record,
+                'ats_min': score, 'ats_max': score, 'ats_sum': score}
+    summary['count'] += 1
+    summary['latest'] = record
+    summary['ats_min'] = min(summary['ats_min'], score)
+    summary['ats_max'] = max(summary['ats_max'], score)
+    summary['ats_sum'] += score
+    return summary
+
+
+def _finish_summary(summary):
+    if summary is None:
+        return None
+    summary = dict(summary)
+    summary['ats_mean'] = summary['ats_sum'] / summary['count']
+    return summary
+
+
+class HistoryAggregates:
+    """
+    Running statistics over the analytics history, kept in the history database
+    add() updates the overall summary (first/latest record, min/max/mean ATS
+    score), per-day buckets and skill counts in O(1) per record; callers run it
+    inside the transaction that appends the record so both stay consistent.
+    """
+
+    def __init__(self, db):
+        self._db = db
+        self._db.execute("CREATE TABLE IF NOT EXISTS aggregates (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS daily ("
+            "day TEXT PRIMARY KEY, count INTEGER NOT NULL, score_sum REAL NOT NULL, "
+            "score_min REAL NOT NULL, score_max REAL NOT NULL, last_score REAL NOT NULL)"
+        )
+        self._db.execute("CREATE TABLE IF NOT EXISTS skill_counts (skill TEXT PRIMARY KEY, count INTEGER NOT NULL)")
+
+    def add(self, record):
+        """Fold one new record into every aggregate"""
+        row = self._db.execute("SELECT value FROM aggregates WHERE name = 'summary'").fetchone()
+        summary = _add_to_summary(json.loads(row[0]) if row else None, record)
+        self._db.execute(
+            "INSERT OR REPLACE INTO aggregates (name, value) VALUES ('summary', ?)", (json.dumps(summary),)
+        )
+
+        score = record['ats_score']
+        self._db.execute(
+            "INSERT INTO daily (day, count, score_sum, score_min, score_max, last_score) "
+            "VALUES (?, 1, ?, ?, ?, ?) "
+            "ON CONFLICT(day) DO UPDATE SET count = count + 1, score_sum = score_sum + excluded.score_sum, "
+            "score_min = MIN(score_min, excluded.score_min), score_max = MAX(score_max, excluded.score_max), "
+            "last_score = excluded.last_score",
+            (day_of(record), score, score, score, score)
+        )
+
+        # Records saved before skill names were stored only carry a count
+        self._db.executemany(
+            "INSERT INTO skill_counts (skill, count) VALUES (?, 1) "
+            "ON CONFLICT(skill) DO UPDATE SET count = count + 1",
+            [(skill,) for skill in set(record.get('skills', []))]
+        )
+
+    def reset(self):
+        """Drop every aggregate"""
+        self._db.execute("DELETE FROM aggregates")
+        self._db.execute("DELETE FROM daily")
+        self._db.execute("DELETE FROM skill_counts")
+
+    def is_empty(self):
+        return self._db.execute("SELECT 1 FROM aggregates WHERE name = 'summary'").fetchone() is None
+
+    def summary(self):
+        """count, first, latest, ats_min, ats_max, ats_mean over all history (None when empty)"""
+        row = self._db.execute("SELECT value FROM aggregates WHERE name = 'summary'").fetchone()
+        return _finish_summary(json.loads(row[0])) if row else None
+
+    def daily(self, since=None):
+        """Per-day buckets in date order, optionally only from a YYYY-MM-DD day on"""
+        sql = "SELECT day, count, score_sum, score_min, score_max, last_score FROM daily"
+        params = []
+        if since is not None:
+            sql += " WHERE day >= ?"
+            params.append(since)
+        sql += " ORDER BY day"
+        return [
+            {'day': day, 'count': count, 'ats_mean': score_sum / count,
+             'ats_min': score_min, 'ats_max': score_max, 'ats_last': last_score}
+            for day, count, score_sum, score_min, score_max, last_score in self._db.execute(sql, params)
+        ]
+
+    def top_skills(self, n=10):
+        """The n skills found in the most saved analyses, as (skill, count)"""
+        return self._db.execute(
+            "SELECT skill, count FROM skill_counts ORDER BY count DESC, skill LIMIT ?", (n,)
+        ).fetchall()
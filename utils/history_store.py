@@ -0,0 +1,161 @@
+import json
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+
+from utils.history_aggregates import HistoryAggregates
+
+HISTORY_DIR = 'analytics_data'
+DEFAULT_HISTORY_PATH = os.path.join(HISTORY_DIR, 'history.db')
+# Whole-file JSON history written by earlier versions; imported once on first open
+LEGACY_HISTORY_PATH = os.path.join(HISTORY_DIR, 'history.json')
+
+
+class HistoryStore:
+    """
+    Append-only analytics history backed by SQLite in WAL mode
+    Each append is one INSERT in its own transaction, so saves are atomic,
+    never rewrite earlier records and do not lose concurrent writes. Records are
+    returned as the dicts they were saved as, oldest first. Running aggregates
+    (see HistoryAggregates) are updated in the same transaction as each append.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH, legacy_path=LEGACY_HISTORY_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS analyses ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "timestamp TEXT NOT NULL, version_name TEXT, record TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS analyses_timestamp ON analyses (timestamp)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS analyses_version ON analyses (version_name)")
+        self.aggregates = HistoryAggregates(self._db)
+        self._db.commit()
+
+        # Histories saved before aggregates existed are folded in once
+        if self.aggregates.is_empty() and self.count():
+            self.rebuild_aggregates()
+
+        if legacy_path and os.path.exists(legacy_path):
+            self.import_json(legacy_path)
+
+    def append(self, record):
+        """Save one analysis and return its id"""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "INSERT INTO analyses (timestamp, version_name, record) VALUES (?, ?, ?)",
+                (record['timestamp'], record.get('version_name'), json.dumps(record))
+            )
+            self.aggregates.add(record)
+        return cursor.lastrowid
+
+    def query(self, since=None, until=None, version_name=None, limit=None):
+        """
+        Records in save order, optionally filtered
+        since / until: ISO timestamps (inclusive / exclusive)
+        version_name: only analyses saved under this version name
+        limit: only the most recent N matching records
+        """
+        clauses = []
+        params = []
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if version_name is not None:
+            clauses.append("version_name = ?")
+            params.append(version_name)
+
+        sql = "SELECT record FROM analyses"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
+
+    def first(self):
+        """Oldest saved analysis, or None"""
+        return self._one("SELECT record FROM analyses ORDER BY id LIMIT 1")
+
+    def latest(self):
+        """Most recent saved analysis, or None"""
+        return self._one("SELECT record FROM analyses ORDER BY id DESC LIMIT 1")
+
+    def count(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def summary(self):
+        """Precomputed first/latest record and min/max/mean ATS score over all history"""
+        with self._lock:
+            return self.aggregates.summary()
+
+    def daily(self, since=None):
+        """Precomputed per-day buckets, optionally from a YYYY-MM-DD day on"""
+        with self._lock:
+            return self.aggregates.daily(since)
+
+    def top_skills(self, n=10):
+        """Most frequent skills across all saved analyses"""
+        with self._lock:
+            return self.aggregates.top_skills(n)
+
+    def clear(self):
+        """Delete every saved analysis and its aggregates"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM analyses")
+            self.aggregates.reset()
+
+    def rebuild_aggregates(self):
+        """Recompute every aggregate with one pass over the stored history"""
+        with self._lock, self._db:
+            self.aggregates.reset()
+            for (record,) in self._db.execute("SELECT record FROM analyses ORDER BY id").fetchall():
+                self.aggregates.add(json.loads(record))
+
+    def import_json(self, path):
+        """Import a legacy history.json in one transaction, then rename it so it is not imported twice"""
+        try:
+            with open(path, 'r') as f:
+                records = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not import {path}: {e}")
+            return 0
+
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT INTO analyses (timestamp, version_name, record) VALUES (?, ?, ?)",
+                [(record['timestamp'], record.get('version_name'), json.dumps(record)) for record in records]
+            )
+            for record in records:
+                self.aggregates.add(record)
+        os.replace(path, path + '.imported')
+        print(f"Imported {len(records)} analyses from {path}")
+        return len(records)
+
+    def _one(self, sql):
+        with self._lock:
+            row = self._db.execute(sql).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+@lru_cache(maxsize=1)
+def get_history_store():
+    """Process-wide store shared by the dashboard and settings pages"""
+    return HistoryStore()
@@ -1,15 +1,39 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.naive_bayes import MultinomialNB
-import pickle
+import numpy as np
+from functools import lru_cache
+import hashlib
+import json
 import os
+import random
+
+# Bump when the training data or model layout changes; older artifacts are then retrained
+MODEL_VERSION = 1
+TRAINING_SEED = 42
+DEFAULT_MODEL_DIR = 'models/job_predictor'
+
+# Arrays stored next to manifest.json, one .npy file each so they can be memory-mapped
+MODEL_ARRAYS = ['idf', 'feature_log_prob', 'class_log_prior']
+
+
+def _sha256(path):
+    """Checksum of a file on disk"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class JobRolePredictor:
     """Predict job role from resume text using ML"""
     
-    def __init__(self):
+    def __init__(self, seed=TRAINING_SEED):
         self.vectorizer = TfidfVectorizer(max_features=500)
         self.model = MultinomialNB()
         self.is_trained = False
+        # Fixed seed so every worker that has to train gets the same model
+        self.seed = seed
         
         # Job roles and their typical keywords
         self.job_roles = {
@@ -27,14 +51,14 @@ class JobRolePredictor:
         """Create synthetic training data from job roles"""
         texts = []
         labels = []
+        rng = random.Random(self.seed)
         
         for role, keywords in self.job_roles.items():
             # Create 10 variations for each role
             for i in range(10):
                 # Randomly combine keywords
-                import random
-                sample_keywords = random.sample(keywords, min(5, len(keywords)))
-                text = ' '.join(sample_keywords * random.randint(2, 5))
+                sample_keywords = rng.sample(keywords, min(5, len(keywords)))
+                text = ' '.join(sample_keywords * rng.randint(2, 5))
                 texts.append(text)
                 labels.append(role)
         
@@ -55,42 +79,128 @@ class JobRolePredictor:
     
     def predict(self, resume_text):
         """Predict job role from resume"""
+        result = self.predict_many([resume_text], top_k=3)[0]
+        
+        return {
+            'predicted_role': result['predicted_role'],
+            'top_3_roles': result['top_roles'],
+            'confidence': result['confidence']
+        }
+    
+    def predict_many(self, resume_texts, top_k=3):
+        """Predict job roles for a batch of resumes with one transform and one predict_proba"""
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        
         if not self.is_trained:
             self.train()
         
-        # Vectorize resume
-        X = self.vectorizer.transform([resume_text.lower()])
+        texts = [text.lower() for text in resume_texts]
+        if not texts:
+            return []
         
-        # Predict
-        prediction = self.model.predict(X)[0]
+        # Vectorize and score the whole batch at once
+        X = self.vectorizer.transform(texts)
+        probabilities = self.model.predict_proba(X)
         
-        # Get probability scores
-        probabilities = self.model.predict_proba(X)[0]
+        # Top-k per row without a full sort, then order just those k columns
+        k = min(top_k, probabilities.shape[1])
+        top = np.argpartition(-probabilities, k - 1, axis=1)[:, :k]
+        top_probs = np.take_along_axis(probabilities, top, axis=1)
+        order = np.argsort(-top_probs, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_probs = np.take_along_axis(top_probs, order, axis=1) * 100
         
-        # Get top 3 predictions
-        top_indices = probabilities.argsort()[-3:][::-1]
-        top_roles = [(self.model.classes_[i], probabilities[i] * 100) for i in top_indices]
+        classes = self.model.classes_
+        labels = classes[top]
         
-        return {
-            'predicted_role': prediction,
-            'top_3_roles': top_roles,
-            'confidence': max(probabilities) * 100
-        }
+        return [
+            {
+                'predicted_role': row_labels[0],
+                'top_roles': list(zip(row_labels, row_probs)),
+                'confidence': row_probs[0]
+            }
+            for row_labels, row_probs in zip(labels, top_probs)
+        ]
     
-    def save_model(self, filepath='models/job_predictor.pkl'):
-        """Save trained model"""
-        os.makedirs('models', exist_ok=True)
-        with open(filepath, 'wb') as f:
-            pickle.dump((self.vectorizer, self.model), f)
-        print(f"Model saved to {filepath}")
+    def save_model(self, directory=DEFAULT_MODEL_DIR):
+        """Save the trained model as a versioned, checksummed artifact directory"""
+        if not self.is_trained:
+            self.train()
+        os.makedirs(directory, exist_ok=True)
+        
+        arrays = {
+            'idf': self.vectorizer.idf_,
+            'feature_log_prob': self.model.feature_log_prob_,
+            'class_log_prior': self.model.class_log_prior_
+        }
+        checksums = {}
+        for name in MODEL_ARRAYS:
+            path = os.path.join(directory, f'{name}.npy')
+            np.save(path, np.ascontiguousarray(arrays[name], dtype=np.float64))
+            checksums[name] = _sha256(path)
+        
+        vocabulary = self.vectorizer.vocabulary_
+        manifest = {
+            'version': MODEL_VERSION,
+            'seed': self.seed,
+            'classes': [str(c) for c in self.model.classes_],
+            'vocabulary': sorted(vocabulary, key=vocabulary.get),
+            'checksums': checksums
+        }
+        # Manifest is written last, so a half-written artifact is never loaded
+        tmp_path = os.path.join(directory, 'manifest.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, os.path.join(directory, 'manifest.json'))
+        print(f"Model saved to {directory}")
     
-    def load_model(self, filepath='models/job_predictor.pkl'):
-        """Load trained model"""
+    def load_model(self, directory=DEFAULT_MODEL_DIR):
+        """Load a saved artifact (arrays memory-mapped), training a new model if it is missing or stale"""
         try:
-            with open(filepath, 'rb') as f:
-                self.vectorizer, self.model = pickle.load(f)
-            self.is_trained = True
-            print(f"Model loaded from {filepath}")
-        except FileNotFoundError:
-            print("No saved model found. Training new model...")
-            self.train()
\ No newline at end of file
+            with open(os.path.join(directory, 'manifest.json')) as f:
+                manifest = json.load(f)
+            if manifest['version'] != MODEL_VERSION:
+                raise ValueError(f"artifact version {manifest['version']}, expected {MODEL_VERSION}")
+            
+            arrays = {}
+            for name in MODEL_ARRAYS:
+                path = os.path.join(directory, f'{name}.npy')
+                if _sha256(path) != manifest['checksums'][name]:
+                    raise ValueError(f"checksum mismatch for {name}.npy")
+                arrays[name] = np.load(path, mmap_mode='r')
+        except (OSError, ValueError, KeyError) as e:
+            print(f"No usable saved model ({e}). Training new model...")
+            self.train()
+            return
+        
+        vocabulary = {term: i for i, term in enumerate(manifest['vocabulary'])}
+        self.vectorizer = TfidfVectorizer(max_features=500, vocabulary=vocabulary)
+        self.vectorizer.idf_ = arrays['idf']
+        
+        self.model = MultinomialNB()
+        self.model.classes_ = np.array(manifest['classes'])
+        self.model.feature_log_prob_ = arrays['feature_log_prob']
+        self.model.class_log_prior_ = arrays['class_log_prior']
+        self.model.n_features_in_ = len(vocabulary)
+        
+        self.seed = manifest['seed']
+        self.is_trained = True
+        print(f"Model loaded from {directory}")
+
+
+@lru_cache(maxsize=1)
+def get_default_predictor():
+    """Process-wide predictor loaded from the default artifact"""
+    predictor = JobRolePredictor()
+    predictor.load_model()
+    return predictor
+
+
+if __name__ == '__main__':
+    # Build step: python -m utils.job_predictor [output directory]
+    import sys
+    
+    predictor = JobRolePredictor()
+    predictor.train()
+    predictor.save_model(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MODEL_DIR)
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import threading
+
+import spacy
+
+MODEL_NAME = 'en_core_web_sm'
+
+# Pipeline components extract_name never uses; excluded so they are never loaded
+UNUSED_COMPONENTS = ['tagger', 'parser', 'lemmatizer', 'attribute_ruler']
+
+# Process-wide registry: model name -> loaded pipeline
+_models = {}
+_lock = threading.Lock()
+
+
+def load_nlp(model_name=MODEL_NAME):
+    """Return the shared spaCy pipeline, loading it once per process"""
+    nlp = _models.get(model_name)
+    if nlp is None:
+        with _lock:
+            nlp = _models.get(model_name)
+            if nlp is None:
+                nlp = _load_pipeline(model_name)
+                _models[model_name] = nlp
+    return nlp
+
+
+def _load_pipeline(model_name):
+    """Load the NER-only pipeline, downloading the model if it is missing"""
+    try:
+        return spacy.load(model_name, exclude=UNUSED_COMPONENTS)
+    except OSError:
+        subprocess.run([sys.executable, '-m', 'spacy', 'download', model_name])
+        return spacy.load(model_name, exclude=UNUSED_COMPONENTS)
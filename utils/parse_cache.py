@@ -0,0 +1,121 @@
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class ParseCache:
+    """Content-addressed cache for extracted text and parse results"""
+
+    def __init__(self, max_items=256, disk_path=None, max_disk_bytes=64 * 1024 * 1024):
+        # In-memory LRU tier
+        self.max_items = max_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Optional on-disk tier shared across restarts (and worker processes)
+        self.max_disk_bytes = max_disk_bytes
+        self._db = None
+        if disk_path:
+            directory = os.path.dirname(disk_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(disk_path, timeout=30, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._db.commit()
+
+    @staticmethod
+    def key(*parts):
+        """Hash the given parts (bytes, str or numbers) into a cache key"""
+        digest = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, bytes):
+                part = str(part).encode('utf-8')
+            # Length prefix keeps ('ab', 'c') and ('a', 'bc') apart
+            digest.update(len(part).to_bytes(8, 'big'))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return a copy of the cached value, or None on a miss"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return copy.deepcopy(self._memory[key])
+
+            if self._db is None:
+                return None
+
+            row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            value = json.loads(row[0])
+            self._remember(key, value)
+            return copy.deepcopy(value)
+
+    def set(self, key, value):
+        """Store a JSON-serialisable value in both tiers"""
+        if value is None:
+            return
+
+        with self._lock:
+            self._remember(key, copy.deepcopy(value))
+
+            if self._db is None:
+                return
+
+            payload = json.dumps(value)
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time())
+            )
+            self._evict_disk()
+            self._db.commit()
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM entries")
+                self._db.commit()
+
+    def _remember(self, key, value):
+        """Insert into the memory tier, evicting the least recently used entries"""
+        if self.max_items <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        """Delete least recently used rows until the disk tier fits its budget"""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+
+        excess = total - self.max_disk_bytes
+        stale = []
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+
+# Process-wide cache used by parsers that are not given one explicitly.
+# Set RESUME_CACHE_PATH to also persist results to an SQLite file.
+default_cache = ParseCache(disk_path=os.environ.get('RESUME_CACHE_PATH'))
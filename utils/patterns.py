@@ -0,0 +1,91 @@
+import re
+
+# Every regex the parser, scorer and improver use, compiled once at import.
+# Extractors call these directly instead of handing pattern strings to re.*,
+# which would go through re's internal cache on every call.
+
+# Contact details
+EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Tried in order; the first candidate with 10-15 digits wins
+PHONE_PATTERNS = (
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # +1-234-567-8900
+    re.compile(r'\+?\d{2}[-.\s]?\d{10}'),  # +91-9876543210
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # (123) 456-7890
+    re.compile(r'\d{10}'),  # 9876543210
+)
+NON_DIGIT = re.compile(r'\D')
+
+# Looser phone check used by the ATS contact score
+ATS_PHONE = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
+
+# Profile links
+LINKEDIN = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+', re.IGNORECASE)
+GITHUB = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[\w-]+', re.IGNORECASE)
+URL = re.compile(r'https?://(?:www\.)?[\w\-\.]+\.\w{2,}(?:/[\w\-\./?%&=]*)?')
+
+# Education: every degree in one alternation, one named group per degree.
+# Longer spellings come first, the lookarounds stop "ma" in "machine" from
+# counting, and bare BE/BA/MA must be upper case so "to be" is not a degree.
+DEGREE = re.compile(
+    r'(?<!\w)(?:'
+    r'(?P<btech>Bachelor of Technology|B\.?Tech)'
+    r'|(?P<be>Bachelor of Engineering|B\.E\.?|(?-i:BE))'
+    r'|(?P<mtech>Master of Technology|M\.?Tech)'
+    r'|(?P<mba>Master of Business Administration|MBA)'
+    r'|(?P<bca>Bachelor of Computer Applications|BCA)'
+    r'|(?P<mca>Master of Computer Applications|MCA)'
+    r'|(?P<bsc>Bachelor of Science|B\.?Sc)'
+    r'|(?P<msc>Master of Science|M\.?Sc)'
+    r'|(?P<phd>Doctorate|Ph\.?D)'
+    r'|(?P<ba>Bachelor of Arts|B\.A\.?|(?-i:BA))'
+    r'|(?P<ma>Master of Arts|M\.A\.?|(?-i:MA))'
+    r')(?!\w)',
+    re.IGNORECASE
+)
+UNIVERSITY = re.compile(r'(?:at|from)?\s*([A-Z][A-Za-z\s&,\.]+(?:University|College|Institute|School))')
+
+# Years and date ranges ("Jan 2020 - Present", "March 2018 to Dec 2020", "03/2018 - 2021")
+YEAR = re.compile(r'20\d{2}|19\d{2}')
+_MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+_FULL_YEAR = r'(?:19|20)\d{2}'
+
+
+def _range_end(side):
+    """One end of a date range, "Mar 2018", "03/2018" or "2018", with groups named after side"""
+    return (
+        rf'(?:(?P<{side}_month>{_MONTH})[a-z]*\.?\s+(?P<{side}_year>{_FULL_YEAR})'
+        rf'|(?P<{side}_mm>0?[1-9]|1[0-2])/(?P<{side}_mm_year>{_FULL_YEAR})'
+        rf'|(?P<{side}_yyyy>{_FULL_YEAR}))\b'
+    )
+
+
+# A range never starts inside a longer date or number ("12/03/2018", "555-2015")
+DATE_RANGE = re.compile(
+    rf'(?<![/-])\b{_range_end("start")}\s*(?:-|–|—|to|till|until)\s*'
+    rf'(?:{_range_end("end")}|(?P<present>Present|Current|Now|Today)\b)',
+    re.IGNORECASE
+)
+
+# Experience: a title is the run of letters and spaces around a title keyword;
+# the company follows " at " on the same line. None of these can backtrack.
+TITLE_KEYWORDS = [
+    'engineer', 'developer', 'analyst', 'manager', 'consultant',
+    'intern', 'associate', 'specialist', 'architect', 'lead',
+    'designer', 'scientist', 'administrator', 'coordinator'
+]
+TITLE_KEYWORD = re.compile(r'\b(?:' + '|'.join(TITLE_KEYWORDS) + r')\b', re.IGNORECASE)
+LETTER_RUN = re.compile(r'[A-Za-z][A-Za-z ]*')
+AT = re.compile(r' at ', re.IGNORECASE)
+# A company name stops at a separator, a double space or a following date ("Foo Corp Mar 2017")
+COMPANY = re.compile(
+    rf'([A-Z](?:[A-Za-z&.]| (?! |{_MONTH}[a-z]*\.?\s+(?:19|20)\d{{2}}))*)'
+)
+
+# Scoring and suggestions
+METRICS = re.compile(r'\d+%|\d+ users|\d+ projects')
+IMPACT_NUMBERS = re.compile(r'\d+%|\d+ users|\d+ projects|\$\d+')
+KEYWORD = re.compile(r'\b[a-z]{4,}\b')
+
+# Duplicate detection
+WORD = re.compile(r'\w+')
@@ -1,59 +1,112 @@
+import numpy as np
+from utils.ats_scorer import get_job_matcher
+from utils.dedupe import DuplicateDetector
+from utils.feature_table import FeatureTable
+
+# Points per unit of each feature in the overall comparison score
+DEFAULT_WEIGHTS = {
+    'skills': 2,            # per skill
+    'experience_years': 5,  # per year of experience
+    'has_email': 5,
+    'has_phone': 5,
+    'has_linkedin': 5,
+    'has_github': 5,
+    'education': 10,        # per degree
+    'experience_count': 5,  # per role
+}
+# Share of the final score taken by job description similarity when a JD is given
+DEFAULT_JD_WEIGHT = 0.3
+# Estimated text similarity above which two resumes count as the same candidate
+DEFAULT_DUPLICATE_THRESHOLD = 0.8
+
+
 class ResumeComparator:
     """Compare multiple resumes and rank them"""
     
-    def __init__(self):
-        pass
+    def __init__(self, weights=None, jd_weight=DEFAULT_JD_WEIGHT, duplicate_threshold=DEFAULT_DUPLICATE_THRESHOLD):
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.jd_weight = jd_weight
+        # None turns duplicate detection off: every resume is its own cluster
+        self.detector = DuplicateDetector(threshold=duplicate_threshold) if duplicate_threshold is not None else None
     
-    def compare_resumes(self, resumes_data, job_description=""):
+    def compare_resumes(self, resumes_data, job_description="", top_k=None):
         """
         Compare multiple resumes
-        resumes_data: list of dicts with 'name' and 'parsed_data' keys
+        resumes_data: list of dicts with 'name', 'text' and 'parsed_data' keys
+        job_description: when given, a 'jd_match' column (0-100) is added and blended
+                         into the score with weight jd_weight
+        top_k: only return the best k resumes (partial sort for large pools)
+        Every result carries its position in resumes_data as 'index', a
+        'cluster_id' shared by near-duplicate resumes (the same candidate submitted
+        more than once) and 'cluster_size', the number of resumes in its cluster.
         """
-        comparisons = []
+        if not resumes_data:
+            return []
+        
+        # Whole-batch feature columns, scored with one matrix-vector product
+        table = FeatureTable(resume['parsed_data'] for resume in resumes_data)
+        skills = table.technical_count + table.soft_count
+        columns = {
+            'skills': skills,
+            'experience_years': table.experience_years,
+            'has_email': table.has_email,
+            'has_phone': table.has_phone,
+            'has_linkedin': table.has_linkedin,
+            'has_github': table.has_github,
+            'education': table.education_count,
+            'experience_count': table.experience_count,
+        }
+        features = np.column_stack([columns[name] for name in self.weights]).astype(float)
+        weights = np.array(list(self.weights.values()), dtype=float)
+        scores = np.minimum(features @ weights, 100)  # Cap at 100
         
-        for resume in resumes_data:
-            name = resume['name']
-            data = resume['parsed_data']
-            text = resume['text']
-            
-            # Calculate metrics
-            total_skills = data['skills']['total_count']
-            experience_years = data['experience']['total_years']
-            has_email = 1 if data['contact_info']['email'] else 0
-            has_phone = 1 if data['contact_info']['phone'] else 0
-            has_linkedin = 1 if data['contact_info']['links']['linkedin'] else 0
-            has_github = 1 if data['contact_info']['links']['github'] else 0
-            education_count = len(data.get('education', []))
-            experience_count = len(data['experience']['details'])
-            
-            # Calculate overall score (0-100)
-            score = (
-                (total_skills * 2) +  # Skills worth 2 points each
-                (experience_years * 5) +  # Experience worth 5 points per year
-                (has_email * 5) +
-                (has_phone * 5) +
-                (has_linkedin * 5) +
-                (has_github * 5) +
-                (education_count * 10) +
-                (experience_count * 5)
-            )
-            
-            score = min(score, 100)  # Cap at 100
-            
-            comparisons.append({
-                'name': name,
-                'score': score,
-                'skills': total_skills,
-                'experience': experience_years,
-                'education': education_count,
-                'completeness': (has_email + has_phone + has_linkedin + has_github) * 25
-            })
+        texts = [resume['text'] for resume in resumes_data]
+        jd_match = None
+        if job_description:
+            jd_match = get_job_matcher(job_description).score_many(texts)
+            scores = (1 - self.jd_weight) * scores + self.jd_weight * jd_match
         
-        # Sort by score descending
-        comparisons.sort(key=lambda x: x['score'], reverse=True)
+        if self.detector is not None:
+            cluster_ids = self.detector.clusters(texts)
+        else:
+            cluster_ids = np.arange(len(texts))
+        cluster_sizes = np.bincount(cluster_ids)[cluster_ids]
+        
+        order = self._rank(scores, top_k)
+        
+        comparisons = []
+        for i in order:
+            comparison = {
+                'index': int(i),
+                'name': resumes_data[i]['name'],
+                'score': round(float(scores[i]), 2),
+                'skills': int(skills[i]),
+                'experience': float(table.experience_years[i]),
+                'education': int(table.education_count[i]),
+                'completeness': int(table.completeness[i]),
+                'cluster_id': int(cluster_ids[i]),
+                'cluster_size': int(cluster_sizes[i])
+            }
+            if jd_match is not None:
+                comparison['jd_match'] = float(jd_match[i])
+            comparisons.append(comparison)
         
         return comparisons
     
+    def _rank(self, scores, top_k=None):
+        """Indices by descending score (ties keep input order), optionally only the top k"""
+        if top_k is None or top_k >= len(scores):
+            return np.argsort(-scores, kind='stable')
+        if top_k <= 0:
+            return np.array([], dtype=int)
+        
+        # Partial selection of the k best, then a sort of just those k
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        boundary = scores[top].min()
+        # Rows tied with the k-th score compete by input order, as in a full stable sort
+        candidates = np.flatnonzero(scores >= boundary)
+        return candidates[np.lexsort((candidates, -scores[candidates]))][:top_k]
+    
     def generate_comparison_report(self, comparisons):
         """Generate a text report of comparison"""
         report = "RESUME COMPARISON REPORT\n"
@@ -62,10 +115,14 @@ class ResumeComparator:
         for i, comp in enumerate(comparisons, 1):
             report += f"{i}. {comp['name']}\n"
             report += f"   Overall Score: {comp['score']}/100\n"
+            if 'jd_match' in comp:
+                report += f"   Job Match: {comp['jd_match']:.1f}%\n"
             report += f"   Skills: {comp['skills']}\n"
             report += f"   Experience: {comp['experience']} years\n"
             report += f"   Education: {comp['education']} degree(s)\n"
             report += f"   Profile Completeness: {comp['completeness']}%\n"
+            if comp.get('cluster_size', 1) > 1:
+                report += f"   Possible Duplicate: group {comp['cluster_id']} ({comp['cluster_size']} resumes)\n"
             report += "\n"
         
         return report
\ No newline at end of file
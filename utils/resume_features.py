@@ -0,0 +1,28 @@
+from utils import patterns
+from utils.text_normalizer import normalize
+
+SECTION_KEYWORDS = ['education', 'experience', 'skills', 'projects']
+
+
+class ResumeFeatures:
+    """Text features computed once per resume and shared by parser, scorer and improver"""
+
+    def __init__(self, text, email=None, phone=None):
+        # Raw text is normalized once; a ResumeDocument is used as is
+        self.document = normalize(text)
+        self.text = self.document
+        self.text_lower = self.document.flat_lower
+        self.tokens = self.document.split()
+        self.word_count = len(self.tokens)
+        self.line_count = len(self.document.lines)
+        self.has_bullets = '•' in self.document or '-' in self.document
+        # Section headings come from the document's one-scan SectionIndex
+        self.sections = {section for section in SECTION_KEYWORDS if section in self.document.sections}
+
+        # Contact checks behind the ATS score, so every scoring path rates contact details alike
+        self.ats_email = patterns.EMAIL.search(self.document) is not None
+        self.ats_phone = patterns.ATS_PHONE.search(self.document) is not None
+
+        # Contact hits, filled in by the parser so nothing re-runs its regexes
+        self.email = email
+        self.phone = phone
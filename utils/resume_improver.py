@@ -1,3 +1,6 @@
+from utils import patterns
+from utils.resume_features import ResumeFeatures
+
 class ResumeImprover:
     """Generate specific improvement suggestions for resumes"""
     
@@ -13,8 +16,11 @@ class ResumeImprover:
             'collaboratively', 'independently', 'proactively'
         ]
     
-    def analyze_and_suggest(self, parsed_data, resume_text):
+    def analyze_and_suggest(self, parsed_data, resume_text, features=None):
         """Generate comprehensive improvement suggestions"""
+        if features is None:
+            features = ResumeFeatures(resume_text)
+        
         suggestions = {
             'critical': [],
             'important': [],
@@ -59,7 +65,7 @@ class ResumeImprover:
             })
         
         # Check for action verbs
-        has_action_verbs = any(verb.lower() in resume_text.lower() for verb in self.action_verbs)
+        has_action_verbs = any(verb.lower() in features.text_lower for verb in self.action_verbs)
         if not has_action_verbs:
             suggestions['important'].append({
                 'issue': 'Weak Action Verbs',
@@ -68,8 +74,7 @@ class ResumeImprover:
             })
         
         # Check for quantifiable achievements
-        import re
-        has_numbers = bool(re.search(r'\d+%|\d+ users|\d+ projects|\$\d+', resume_text))
+        has_numbers = bool(patterns.IMPACT_NUMBERS.search(resume_text))
         if not has_numbers:
             suggestions['important'].append({
                 'issue': 'Lack of Quantifiable Achievements',
@@ -92,7 +97,7 @@ class ResumeImprover:
                 'example': 'Software Developer Intern at ABC Company (June 2022 - Aug 2022)'
             })
         
-        word_count = len(resume_text.split())
+        word_count = features.word_count
         if word_count < 200:
             suggestions['nice_to_have'].append({
                 'issue': 'Resume Too Short',
@@ -1,142 +1,380 @@
+import io
+import multiprocessing
+import os
 import re
-import spacy
-import pdfplumber
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+from itertools import islice
 from docx import Document
+from utils import patterns
+from utils.date_spans import DateSpanIndex
+from utils.nlp_models import load_nlp
+from utils.parse_cache import ParseCache, default_cache
+from utils.resume_features import ResumeFeatures
+from utils.section_index import HEADING_WORDS, SECTION_HEADINGS
+from utils.text_extractor import TextExtractor, iter_pdf_pages
+from utils.text_normalizer import ResumeDocument, normalize
+
+# Skill name -> aliases. Every alias is matched on word boundaries, so short
+# aliases like 'c', 'r' and 'git' never fire inside longer words.
+TECHNICAL_SKILLS = {
+    # Programming Languages (exact matches needed)
+    'python': ['python'],
+    'java': ['java', 'javase', 'javaee'],
+    'javascript': ['javascript', 'js'],
+    'c++': ['c++', 'cpp'],
+    'c#': ['c#', 'csharp'],
+    'c': ['c'],
+    'ruby': ['ruby'],
+    'php': ['php'],
+    'swift': ['swift'],
+    'kotlin': ['kotlin'],
+    'go': ['golang', 'go'],
+    'rust': ['rust'],
+    'typescript': ['typescript', 'ts'],
+    'r': ['r'],
+    'matlab': ['matlab'],
+    'scala': ['scala'],
+
+    # Web Technologies
+    'html': ['html', 'html5'],
+    'css': ['css', 'css3'],
+    'react': ['react', 'reactjs', 'react.js'],
+    'angular': ['angular', 'angularjs'],
+    'vue': ['vue', 'vuejs', 'vue.js'],
+    'node.js': ['node.js', 'nodejs', 'node'],
+    'express': ['express', 'expressjs', 'express.js'],
+    'django': ['django'],
+    'flask': ['flask'],
+    'spring': ['spring', 'spring boot', 'springboot'],
+    'asp.net': ['asp.net', 'aspnet'],
+    'jquery': ['jquery'],
+    'bootstrap': ['bootstrap'],
+    'tailwind': ['tailwind', 'tailwindcss'],
+
+    # Databases
+    'sql': ['sql'],
+    'mysql': ['mysql'],
+    'postgresql': ['postgresql', 'postgres'],
+    'mongodb': ['mongodb', 'mongo'],
+    'oracle': ['oracle db', 'oracle'],
+    'redis': ['redis'],
+    'cassandra': ['cassandra'],
+    'dynamodb': ['dynamodb'],
+    'sqlite': ['sqlite'],
+    'firebase': ['firebase'],
+    'nosql': ['nosql'],
+
+    # ML/AI
+    'machine learning': ['machine learning', 'ml'],
+    'deep learning': ['deep learning', 'dl'],
+    'tensorflow': ['tensorflow'],
+    'pytorch': ['pytorch'],
+    'keras': ['keras'],
+    'scikit-learn': ['scikit-learn', 'sklearn', 'scikit learn'],
+    'pandas': ['pandas'],
+    'numpy': ['numpy'],
+    'opencv': ['opencv'],
+    'nlp': ['nlp', 'natural language processing'],
+    'computer vision': ['computer vision', 'cv'],
+    'neural networks': ['neural networks', 'neural network', 'nn'],
+    'ai': ['artificial intelligence', 'ai'],
+
+    # Cloud & DevOps
+    'aws': ['aws', 'amazon web services'],
+    'azure': ['azure', 'microsoft azure'],
+    'gcp': ['gcp', 'google cloud'],
+    'google cloud': ['google cloud platform', 'google cloud'],
+    'docker': ['docker'],
+    'kubernetes': ['kubernetes', 'k8s'],
+    'jenkins': ['jenkins'],
+    'git': ['git'],
+    'github': ['github'],
+    'gitlab': ['gitlab'],
+    'ci/cd': ['ci/cd', 'ci cd', 'cicd'],
+    'terraform': ['terraform'],
+    'ansible': ['ansible'],
+
+    # Other
+    'rest api': ['rest api', 'restful', 'rest'],
+    'graphql': ['graphql'],
+    'microservices': ['microservices', 'micro services'],
+    'agile': ['agile'],
+    'scrum': ['scrum'],
+    'linux': ['linux'],
+    'unix': ['unix'],
+    'bash': ['bash'],
+    'power bi': ['power bi', 'powerbi'],
+    'tableau': ['tableau'],
+    'excel': ['excel', 'ms excel'],
+    'data structures': ['data structures', 'dsa'],
+    'algorithms': ['algorithms', 'algo'],
+    'oop': ['oop', 'object oriented'],
+    'testing': ['testing', 'unit testing']
+}
+
+SOFT_SKILLS = {
+    'leadership': ['leadership', 'leader', 'leading'],
+    'communication': ['communication', 'communicate'],
+    'teamwork': ['teamwork', 'team work', 'team player'],
+    'problem solving': ['problem solving', 'problem-solving'],
+    'critical thinking': ['critical thinking'],
+    'time management': ['time management'],
+    'adaptability': ['adaptability', 'adaptable'],
+    'collaboration': ['collaboration', 'collaborate'],
+    'creativity': ['creativity', 'creative'],
+    'analytical': ['analytical', 'analysis'],
+    'presentation': ['presentation'],
+    'negotiation': ['negotiation'],
+    'conflict resolution': ['conflict resolution'],
+    'decision making': ['decision making', 'decision-making']
+}
+
+
+_WORD_BOUNDARY = re.compile(r'\b')
+
+# A capitalised word that could be part of a person's name ("John", "O-Neil", "J.")
+NAME_WORD = re.compile(r"[A-Z][A-Za-z.\-]*$")
+
+# Places that head a resume in a name-like form ("Bangalore India", "Hyderabad Telangana")
+LOCATION_WORDS = {
+    'india', 'usa', 'america', 'states', 'kingdom', 'uk', 'canada', 'australia', 'germany',
+    'singapore', 'uae', 'dubai', 'london', 'toronto',
+    'bangalore', 'bengaluru', 'mumbai', 'delhi', 'noida', 'gurgaon', 'gurugram', 'hyderabad',
+    'secunderabad', 'chennai', 'kolkata', 'pune', 'ahmedabad', 'jaipur', 'lucknow', 'kochi',
+    'indore', 'bhopal', 'nagpur', 'surat', 'chandigarh', 'coimbatore', 'mysore', 'mysuru',
+    'visakhapatnam', 'thiruvananthapuram', 'trivandrum', 'bhubaneswar', 'patna', 'vadodara',
+    'andhra', 'pradesh', 'telangana', 'karnataka', 'kerala', 'maharashtra', 'nadu', 'gujarat',
+    'rajasthan', 'punjab', 'haryana', 'uttar', 'madhya', 'bengal', 'bihar', 'odisha', 'assam',
+    'goa', 'jharkhand', 'uttarakhand', 'himachal', 'ncr'
+}
+
+# Header words that rule out the name fast path: section headings, job titles, skills
+# and places. Skill words of one or two letters are left out so initials ("John R Doe")
+# still pass; a real name that shares a word ("Ruby Smith") only costs an NER call.
+NOT_NAME_WORDS = (
+    {'resume', 'curriculum', 'vitae', 'cv', 'contact', 'personal', 'information', 'software', 'enthusiast'}
+    | {word for aliases in SECTION_HEADINGS.values() for alias in aliases for word in alias.split()}
+    | set(HEADING_WORDS)
+    | set(patterns.TITLE_KEYWORDS)
+    | {
+        word for table in (TECHNICAL_SKILLS, SOFT_SKILLS) for aliases in table.values()
+        for alias in aliases for word in alias.split() if len(word) > 2
+    }
+    | LOCATION_WORDS
+)
+
+# Sections whose date ranges are studies or side work, never employment
+NON_EXPERIENCE_SECTIONS = ('education', 'projects', 'certifications')
+
+
+class SkillMatcher:
+    """Find every skill alias in a single pass over lowercased text"""
+    
+    def __init__(self, skill_tables):
+        # Alias -> [(category, display name)]; one alias may map to several skills
+        self.aliases = {}
+        for category, table in skill_tables.items():
+            for skill_name, aliases in table.items():
+                for alias in aliases:
+                    self.aliases.setdefault(alias, []).append((category, skill_name.title()))
+        
+        # Longest alias first so the alternation reports the longest hit at each position.
+        # The lookahead keeps matches zero-width, so overlapping aliases ('js' in 'node.js')
+        # are still found further along the text.
+        ordered = sorted(self.aliases, key=len, reverse=True)
+        self.pattern = re.compile(
+            r'\b(?=(' + '|'.join(re.escape(alias) for alias in ordered) + r')\b)'
+        )
+        
+        # Shorter aliases that can match at the same position as a longer one ('c' / 'c++')
+        self.prefixes = {
+            alias: [other for other in ordered if len(other) < len(alias) and alias.startswith(other)]
+            for alias in ordered
+        }
+        self.categories = list(skill_tables)
+    
+    def find(self, text_lower):
+        """Return {category: set of display names} found in the text"""
+        found = {category: set() for category in self.categories}
+        
+        for match in self.pattern.finditer(text_lower):
+            alias = match.group(1)
+            start = match.start()
+            hits = [alias] + [
+                prefix for prefix in self.prefixes[alias]
+                if _WORD_BOUNDARY.match(text_lower, start + len(prefix))
+            ]
+            for hit in hits:
+                for category, skill_name in self.aliases[hit]:
+                    found[category].add(skill_name)
+        
+        return found
+
 
 class ResumeParser:
     """Parse resume and extract structured information from multiple file formats"""
     
-    def __init__(self):
-        # Load spaCy model for NER
-        self.nlp = spacy.load('en_core_web_sm')
-    
-    def read_file(self, file_path):
-        """Read and extract text from different file formats"""
-        if file_path.endswith('.pdf'):
-            return self._read_pdf(file_path)
-        elif file_path.endswith('.docx'):
-            return self._read_docx(file_path)
-        elif file_path.endswith('.txt'):
-            return self._read_txt(file_path)
-        else:
+    # Built once at import; shared by every parser instance
+    skill_matcher = SkillMatcher({'technical': TECHNICAL_SKILLS, 'soft': SOFT_SKILLS})
+    
+    # Bump whenever extraction or parsing output changes so cached results are not reused
+    PARSER_VERSION = 11
+    
+    # Name extraction only looks at this header window
+    HEADER_LINES = 5
+    HEADER_CHARS = 200
+    
+    # parse_many only starts worker processes for at least this many uncached files;
+    # spawning them costs seconds, far more than extracting a handful in-process
+    PARALLEL_MIN_FILES = 32
+    
+    def __init__(self, cache=None):
+        # Content-addressed cache of extracted text and parse results
+        self.cache = cache if cache is not None else default_cache
+    
+    @property
+    def nlp(self):
+        """spaCy NER pipeline shared by every parser in the process"""
+        return load_nlp()
+    
+    def read_file(self, file_path, strict=False):
+        """
+        Read and extract text from different file formats
+        strict: raise ValueError with the reason instead of printing it and returning None
+        """
+        if os.path.splitext(file_path)[1].lower() not in ('.pdf', '.docx', '.txt'):
             raise ValueError("Unsupported file format. Use PDF, DOCX, or TXT")
+        
+        with open(file_path, 'rb') as f:
+            return self.extract_text_from_bytes(file_path, f.read(), strict=strict)
     
-    def _read_pdf(self, file_path):
-        """Extract text from PDF file"""
-        text = ""
+    def _read_pdf(self, file_path, strict=False):
+        """Extract text from PDF file (path or binary stream)"""
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return self._clean_text(text)
+            pages = iter_pdf_pages(
+                file_path,
+                max_pages=TextExtractor.MAX_PDF_PAGES,
+                max_bytes=TextExtractor.MAX_PDF_BYTES,
+                timeout=TextExtractor.PDF_TIMEOUT
+            )
+            return normalize("\n".join(pages))
         except Exception as e:
+            if strict:
+                raise ValueError(f"Error reading PDF: {e}") from e
             print(f"Error reading PDF: {e}")
             return None
     
-    def _read_docx(self, file_path):
-        """Extract text from DOCX file"""
+    def _read_docx(self, file_path, strict=False):
+        """Extract text from DOCX file (path or binary stream)"""
         try:
             doc = Document(file_path)
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return self._clean_text(text)
+            return normalize(text)
         except Exception as e:
+            if strict:
+                raise ValueError(f"Error reading DOCX: {e}") from e
             print(f"Error reading DOCX: {e}")
             return None
     
-    def _read_txt(self, file_path):
-        """Extract text from TXT file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            return self._clean_text(text)
-        except Exception as e:
-            print(f"Error reading TXT: {e}")
-            return None
-    
-    def _clean_text(self, text):
-        """Clean extracted text"""
-        if not text:
-            return ""
-        
-        # Remove extra whitespaces
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep essential punctuation
-        text = re.sub(r'[^\w\s@.,:()\-/]', '', text)
-        return text.strip()
-    
     def extract_text_from_uploaded_file(self, uploaded_file):
         """Extract text from Streamlit uploaded file object"""
-        file_name = uploaded_file.name
-        
-        if file_name.endswith('.txt'):
-            return self._clean_text(uploaded_file.getvalue().decode('utf-8'))
-        
-        elif file_name.endswith('.pdf'):
-            # Save temporarily
-            with open("temp_file.pdf", "wb") as f:
-                f.write(uploaded_file.getvalue())
-            text = self._read_pdf("temp_file.pdf")
-            # Clean up temp file
-            import os
-            os.remove("temp_file.pdf")
-            return text
-        
-        elif file_name.endswith('.docx'):
-            # Save temporarily
-            with open("temp_file.docx", "wb") as f:
-                f.write(uploaded_file.getvalue())
-            text = self._read_docx("temp_file.docx")
-            # Clean up temp file
-            import os
-            os.remove("temp_file.docx")
-            return text
-        
+        return self.extract_text_from_bytes(uploaded_file.name, uploaded_file.getvalue())
+    
+    def extract_text_from_bytes(self, file_name, data, strict=False):
+        """
+        Extract text from the raw bytes of an uploaded file, entirely in memory
+        strict: raise ValueError when the file cannot be read or holds no text
+        """
+        extension = os.path.splitext(file_name)[1].lower()
+        key = self._text_key(file_name, data)
+        text = self.cache.get(key)
+        if text is not None:
+            # Only normalized text is ever cached
+            text = ResumeDocument(text)
         else:
-            raise ValueError("Unsupported file format")
+            if extension == '.txt':
+                text = normalize(data.decode('utf-8'))
+            elif extension == '.pdf':
+                text = self._read_pdf(io.BytesIO(data), strict=strict)
+            elif extension == '.docx':
+                text = self._read_docx(io.BytesIO(data), strict=strict)
+            else:
+                raise ValueError("Unsupported file format")
+            self.cache.set(key, text)
+        
+        if strict and not text:
+            raise ValueError("No text found in file")
+        return text
+    
+    def _text_key(self, file_name, data):
+        """Cache key for the extracted text of a file's bytes"""
+        extension = os.path.splitext(file_name)[1].lower()
+        return self.cache.key('text', self.PARSER_VERSION, extension, data)
     
     def extract_name(self, text):
         """Extract name from resume (usually at the top)"""
-        lines = text.split('\n')[:5]  # Check first 5 lines
+        lines = self._header_lines(text)
+        name = self._name_fast_path(lines)
+        if name:
+            return name
         
+        # Run NER once, over the header window only
+        return self._name_from_doc(lines, self.nlp('\n'.join(lines)) if lines else None)
+    
+    def _header_lines(self, text):
+        """Bounded header window: the first few non-empty lines, capped in length"""
+        lines = []
+        budget = self.HEADER_CHARS
+        for line in normalize(text).lines[:self.HEADER_LINES]:
+            lines.append(line[:budget])
+            budget -= len(lines[-1])
+            if budget <= 0:
+                break
+        return lines
+    
+    def _name_fast_path(self, lines):
+        """Return the first header line when it plainly looks like a person's name"""
+        if not lines:
+            return None
+        
+        words = lines[0].split()
+        if not 2 <= len(words) <= 4:
+            return None
+        if any(not NAME_WORD.match(word) or word.lower() in NOT_NAME_WORDS for word in words):
+            return None
+        return lines[0]
+    
+    def _name_from_doc(self, lines, doc):
+        """Pick the name from the spaCy doc of the header window"""
         # Try spaCy NER first
-        for line in lines:
-            if len(line.strip()) > 0:
-                doc = self.nlp(line)
-                for ent in doc.ents:
-                    if ent.label_ == 'PERSON':
-                        return ent.text
+        if doc is not None:
+            for ent in doc.ents:
+                if ent.label_ == 'PERSON':
+                    return ent.text
         
-        # Fallback: first non-empty line that looks like a name
+        # Fallback: first non-empty line that looks like a name and is not a heading,
+        # job title, skill list or place
         for line in lines:
-            line = line.strip()
             words = line.split()
-            if 1 <= len(words) <= 4 and line[0].isupper() and not any(char.isdigit() for char in line):
+            if (1 <= len(words) <= 4 and line[0].isupper() and not any(char.isdigit() for char in line)
+                    and not any(word.lower().strip(',.:|') in NOT_NAME_WORDS for word in words)):
                 return line
         
         return "Name not found"
     
     def extract_email(self, text):
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else None
+        email = patterns.EMAIL.search(text)
+        return email.group() if email else None
     
     def extract_phone(self, text):
         """Extract phone number"""
-        # Multiple phone patterns
-        patterns = [
-            r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-234-567-8900
-            r'\+?\d{2}[-.\s]?\d{10}',  # +91-9876543210
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890
-            r'\d{10}',  # 9876543210
-        ]
-        
-        for pattern in patterns:
-            phones = re.findall(pattern, text)
-            for phone in phones:
-                digits = re.sub(r'\D', '', phone)
+        # Multiple phone patterns, tried in order
+        for pattern in patterns.PHONE_PATTERNS:
+            for phone in pattern.findall(text):
+                digits = patterns.NON_DIGIT.sub('', phone)
                 if 10 <= len(digits) <= 15:
                     return phone.strip()
         
@@ -151,21 +389,17 @@ class ResumeParser:
         }
         
         # LinkedIn pattern
-        linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+'
-        linkedin = re.search(linkedin_pattern, text, re.IGNORECASE)
+        linkedin = patterns.LINKEDIN.search(text)
         if linkedin:
             urls['linkedin'] = linkedin.group()
         
         # GitHub pattern
-        github_pattern = r'(?:https?://)?(?:www\.)?github\.com/[\w-]+'
-        github = re.search(github_pattern, text, re.IGNORECASE)
+        github = patterns.GITHUB.search(text)
         if github:
             urls['github'] = github.group()
         
         # Portfolio/website pattern
-        url_pattern = r'https?://(?:www\.)?[\w\-\.]+\.\w{2,}(?:/[\w\-\./?%&=]*)?'
-        all_urls = re.findall(url_pattern, text)
-        for url in all_urls:
+        for url in patterns.URL.findall(text):
             if 'linkedin' not in url.lower() and 'github' not in url.lower():
                 urls['portfolio'] = url
                 break
@@ -174,277 +408,93 @@ class ResumeParser:
     
     def extract_skills(self, text):
         """Extract technical and soft skills with word boundary checking"""
-        
-        import re
-        
-        technical_skills = {
-            # Programming Languages (exact matches needed)
-            'python': ['python'],
-            'java': ['java', 'javase', 'javaee'],
-            'javascript': ['javascript', 'js'],
-            'c++': ['c++', 'cpp'],
-            'c#': ['c#', 'csharp'],
-            'c': ['\\bc\\b'],  # Word boundary for single letter
-            'ruby': ['ruby'],
-            'php': ['php'],
-            'swift': ['swift'],
-            'kotlin': ['kotlin'],
-            'go': ['\\bgolang\\b', '\\bgo\\b'],  # Specific patterns
-            'rust': ['rust'],
-            'typescript': ['typescript', 'ts'],
-            'r': ['\\br\\b'],  # Word boundary
-            'matlab': ['matlab'],
-            'scala': ['scala'],
-            
-            # Web Technologies
-            'html': ['html', 'html5'],
-            'css': ['css', 'css3'],
-            'react': ['react', 'reactjs', 'react.js'],
-            'angular': ['angular', 'angularjs'],
-            'vue': ['vue', 'vuejs', 'vue.js'],
-            'node.js': ['node.js', 'nodejs', 'node'],
-            'express': ['express', 'expressjs', 'express.js'],
-            'django': ['django'],
-            'flask': ['flask'],
-            'spring': ['spring', 'spring boot', 'springboot'],
-            'asp.net': ['asp.net', 'aspnet'],
-            'jquery': ['jquery'],
-            'bootstrap': ['bootstrap'],
-            'tailwind': ['tailwind', 'tailwindcss'],
-            
-            # Databases
-            'sql': ['sql'],
-            'mysql': ['mysql'],
-            'postgresql': ['postgresql', 'postgres'],
-            'mongodb': ['mongodb', 'mongo'],
-            'oracle': ['oracle db', 'oracle'],
-            'redis': ['redis'],
-            'cassandra': ['cassandra'],
-            'dynamodb': ['dynamodb'],
-            'sqlite': ['sqlite'],
-            'firebase': ['firebase'],
-            'nosql': ['nosql'],
-            
-            # ML/AI
-            'machine learning': ['machine learning', 'ml'],
-            'deep learning': ['deep learning', 'dl'],
-            'tensorflow': ['tensorflow'],
-            'pytorch': ['pytorch'],
-            'keras': ['keras'],
-            'scikit-learn': ['scikit-learn', 'sklearn', 'scikit learn'],
-            'pandas': ['pandas'],
-            'numpy': ['numpy'],
-            'opencv': ['opencv'],
-            'nlp': ['nlp', 'natural language processing'],
-            'computer vision': ['computer vision', 'cv'],
-            'neural networks': ['neural networks', 'neural network', 'nn'],
-            'ai': ['artificial intelligence', '\\bai\\b'],
-            
-            # Cloud & DevOps
-            'aws': ['aws', 'amazon web services'],
-            'azure': ['azure', 'microsoft azure'],
-            'gcp': ['gcp', 'google cloud'],
-            'google cloud': ['google cloud platform', 'google cloud'],
-            'docker': ['docker'],
-            'kubernetes': ['kubernetes', 'k8s'],
-            'jenkins': ['jenkins'],
-            'git': ['\\bgit\\b'],  # Word boundary to avoid "digit"
-            'github': ['github'],
-            'gitlab': ['gitlab'],
-            'ci/cd': ['ci/cd', 'ci cd', 'cicd'],
-            'terraform': ['terraform'],
-            'ansible': ['ansible'],
-            
-            # Other
-            'rest api': ['rest api', 'restful', 'rest'],
-            'graphql': ['graphql'],
-            'microservices': ['microservices', 'micro services'],
-            'agile': ['agile'],
-            'scrum': ['scrum'],
-            'linux': ['linux'],
-            'unix': ['unix'],
-            'bash': ['bash'],
-            'power bi': ['power bi', 'powerbi'],
-            'tableau': ['tableau'],
-            'excel': ['excel', 'ms excel'],
-            'data structures': ['data structures', 'dsa'],
-            'algorithms': ['algorithms', 'algo'],
-            'oop': ['oop', 'object oriented'],
-            'testing': ['testing', 'unit testing']
-        }
-        
-        soft_skills = {
-            'leadership': ['leadership', 'leader', 'leading'],
-            'communication': ['communication', 'communicate'],
-            'teamwork': ['teamwork', 'team work', 'team player'],
-            'problem solving': ['problem solving', 'problem-solving'],
-            'critical thinking': ['critical thinking'],
-            'time management': ['time management'],
-            'adaptability': ['adaptability', 'adaptable'],
-            'collaboration': ['collaboration', 'collaborate'],
-            'creativity': ['creativity', 'creative'],
-            'analytical': ['analytical', 'analysis'],
-            'presentation': ['presentation'],
-            'negotiation': ['negotiation'],
-            'conflict resolution': ['conflict resolution'],
-            'decision making': ['decision making', 'decision-making']
-        }
-        
-        found_technical = set()
-        found_soft = set()
-        
-        text_lower = text.lower()
-        
-        # Find technical skills
-        for skill_name, patterns in technical_skills.items():
-            for pattern in patterns:
-                # Use regex with word boundaries for better matching
-                if '\\b' in pattern:
-                    # Already has word boundaries
-                    if re.search(pattern, text_lower):
-                        found_technical.add(skill_name.title())
-                        break
-                else:
-                    # Add word boundaries
-                    regex_pattern = r'\b' + re.escape(pattern) + r'\b'
-                    if re.search(regex_pattern, text_lower):
-                        found_technical.add(skill_name.title())
-                        break
-        
-        # Find soft skills
-        for skill_name, patterns in soft_skills.items():
-            for pattern in patterns:
-                regex_pattern = r'\b' + re.escape(pattern) + r'\b'
-                if re.search(regex_pattern, text_lower, re.IGNORECASE):
-                    found_soft.add(skill_name.title())
-                    break
+        found = self.skill_matcher.find(normalize(text).flat_lower)
         
         return {
-            'technical': sorted(list(found_technical)),
-            'soft': sorted(list(found_soft)),
-            'total_count': len(found_technical) + len(found_soft)
+            'technical': sorted(found['technical']),
+            'soft': sorted(found['soft']),
+            'total_count': len(found['technical']) + len(found['soft'])
         }
     
-    def _extract_section(self, text, section_keywords):
-        """Helper: Extract text under a section heading"""
-        text_lower = text.lower()
-        
-        for keyword in section_keywords:
-            # Look for section headers
-            patterns = [
-                r'\n\s*' + keyword + r'\s*:?\s*\n',
-                r'\n\s*' + keyword + r'\s*$',
-                r'^' + keyword + r'\s*:?\s*\n'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text_lower, re.MULTILINE)
-                
-                if match:
-                    start = match.end()
-                    
-                    # Find next section (usually starts with capital letter)
-                    next_section = re.search(r'\n[A-Z][A-Z\s]{3,}:?\s*\n', text[start:])
-                    end = start + next_section.start() if next_section else len(text)
-                    
-                    return text[start:end].strip()
-        
-        return None
-    
     def extract_education(self, text):
         """Extract education details"""
         education = []
         
-        degree_patterns = [
-            r'B\.?Tech|Bachelor of Technology|BTech',
-            r'B\.?E\.?|Bachelor of Engineering',
-            r'M\.?Tech|Master of Technology|MTech',
-            r'MBA|Master of Business Administration',
-            r'B\.?Sc|Bachelor of Science|BSc',
-            r'M\.?Sc|Master of Science|MSc',
-            r'BCA|Bachelor of Computer Applications',
-            r'MCA|Master of Computer Applications',
-            r'Ph\.?D|Doctorate|PhD',
-            r'B\.?A\.?|Bachelor of Arts',
-            r'M\.?A\.?|Master of Arts'
-        ]
-        
         # Try to find education section first
-        education_section = self._extract_section(text, 
-            ['education', 'academic', 'qualification', 'academics'])
+        education_section = normalize(text).sections.section_text('education')
         
         if not education_section:
             education_section = text
         
-        # Extract degrees
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, education_section, re.IGNORECASE)
-            for match in matches:
-                # Get context around the degree
-                start = max(0, match.start() - 150)
-                end = min(len(education_section), match.end() + 150)
-                context = education_section[start:end]
-                
-                # Extract year
-                year_pattern = r'20\d{2}|19\d{2}'
-                years = re.findall(year_pattern, context)
-                
-                # Extract university/college
-                uni_pattern = r'(?:at|from)?\s*([A-Z][A-Za-z\s&,\.]+(?:University|College|Institute|School))'
-                university = re.search(uni_pattern, context)
-                
-                education.append({
-                    'degree': match.group(),
-                    'year': years[-1] if years else 'N/A',
-                    'institution': university.group(1).strip() if university else 'N/A'
-                })
+        # Extract degrees (every degree pattern in one scan)
+        for match in patterns.DEGREE.finditer(education_section):
+            # Get context around the degree
+            start = max(0, match.start() - 150)
+            end = min(len(education_section), match.end() + 150)
+            context = education_section[start:end]
+            
+            # Extract year
+            years = patterns.YEAR.findall(context)
+            
+            # Extract university/college
+            university = patterns.UNIVERSITY.search(context)
+            
+            education.append({
+                'degree': match.group(),
+                'year': years[-1] if years else 'N/A',
+                'institution': university.group(1).strip() if university else 'N/A'
+            })
         
         return education
     
     def extract_experience(self, text):
-        """Extract work experience"""
+        """Extract work experience in a single linear pass over the experience section"""
+        return self._experience(text)[0]
+    
+    def _experience(self, text, today=None):
+        """(roles, total months) from one pass over the experience section"""
         experience = []
         
-        # Find experience section
-        exp_section = self._extract_section(text, 
-            ['experience', 'work history', 'employment', 'professional experience', 'work experience'])
-        
-        if not exp_section:
-            exp_section = text
-        
-        # Common job title keywords
-        title_keywords = [
-            'engineer', 'developer', 'analyst', 'manager', 'consultant',
-            'intern', 'associate', 'specialist', 'architect', 'lead',
-            'designer', 'scientist', 'administrator', 'coordinator'
-        ]
-        
-        # Extract job titles
-        for keyword in title_keywords:
-            pattern = r'([A-Z][A-Za-z\s]+?' + keyword + r'[A-Za-z\s]*?)(?:\s+at\s+|\n|,)'
-            titles = re.finditer(pattern, exp_section, re.IGNORECASE)
-            
-            for match in titles:
-                title = match.group(1).strip()
+        # Find experience section (offsets into the normalized document)
+        document = normalize(text)
+        start, end = document.sections.span('experience') or (0, len(document))
+        if not document[start:end].strip():
+            start, end = 0, len(document)
+        
+        # Date ranges are found once up front and looked up per title; when there is no
+        # experience section, ranges under education, projects or certifications still never count
+        excluded = [document.sections.span(section) for section in NON_EXPERIENCE_SECTIONS]
+        date_spans = DateSpanIndex(document, start, end, today=today, exclude=[span for span in excluded if span])
+        
+        titles = []
+        for line_start, line in self._section_lines(document, start, end):
+            for run in patterns.LETTER_RUN.finditer(line):
+                keyword = patterns.TITLE_KEYWORD.search(run.group())
+                if not keyword:
+                    continue
                 
-                # Get context for company and duration
-                start = match.start()
-                end = min(len(exp_section), match.end() + 200)
-                context = exp_section[start:end]
+                # A title stops at " at "; the company follows it
+                title, company = run.group(), 'N/A'
+                at = patterns.AT.search(title, keyword.end())
+                if at:
+                    title = title[:at.start()]
+                    name = patterns.COMPANY.match(line, run.start() + at.end())
+                    if name:
+                        company = name.group(1).strip()
                 
-                # Extract company
-                company_pattern = r'at\s+([A-Z][A-Za-z\s&,\.]+?)(?:\n|,|\s{2,})'
-                company = re.search(company_pattern, context)
-                
-                # Extract duration
-                duration_pattern = r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})\s*[-–to]+\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|Present)'
-                duration = re.search(duration_pattern, context, re.IGNORECASE)
-                
-                experience.append({
-                    'title': title,
-                    'company': company.group(1).strip() if company else 'N/A',
-                    'duration': duration.group() if duration else 'N/A'
-                })
+                titles.append((line_start + run.start(), line_start + len(line), title.strip(), company))
+        
+        for i, (title_start, line_end, title, company) in enumerate(titles):
+            # Duration: first date range after the title, before the next title
+            limit = min(line_end + 200, titles[i + 1][0] if i + 1 < len(titles) else end)
+            span = date_spans.first_between(title_start, limit)
+            
+            experience.append({
+                'title': title,
+                'company': company,
+                'duration': span[1] if span else 'N/A',
+                'months': span[3] - span[2] + 1 if span else 0
+            })
         
         # Remove duplicates
         seen = set()
@@ -455,19 +505,23 @@ class ResumeParser:
                 seen.add(key)
                 unique_exp.append(exp)
         
-        return unique_exp
+        # Overlapping roles are merged so concurrent jobs are not double counted
+        return unique_exp, date_spans.total_months()
     
-    def calculate_experience_years(self, text):
-        """Calculate total years of experience"""
-        year_pattern = r'20\d{2}|19\d{2}'
-        years = [int(y) for y in re.findall(year_pattern, text)]
-        
-        if len(years) >= 2:
-            # Calculate difference between max and min year
-            total_years = max(years) - min(years)
-            return min(total_years, 40)  # Cap at reasonable maximum
-        
-        return 0
+    def _section_lines(self, document, start, end):
+        """(offset, text) for each line of the document between two offsets"""
+        if start >= end:
+            return
+        for index in range(document.line_at(start), document.line_at(end - 1) + 1):
+            line_start = document.line_starts[index]
+            line = document.lines[index]
+            # The first and last lines may only partly belong to the range
+            skip = max(0, start - line_start)
+            yield line_start + skip, line[skip:end - line_start]
+    
+    def calculate_experience_years(self, text, today=None):
+        """Total years of experience from the merged date ranges of all roles"""
+        return round(self._experience(text, today)[1] / 12, 1)
     
     def parse_resume_from_file(self, file_path):
         """Parse resume directly from file path"""
@@ -478,23 +532,175 @@ class ResumeParser:
         
         return self.parse_resume(text)
     
-    def parse_resume(self, text):
+    def extract_features(self, text):
+        """Compute the ResumeFeatures bundle (lowercase text, tokens, contact hits) once"""
+        document = normalize(text)
+        return ResumeFeatures(document, email=self.extract_email(document), phone=self.extract_phone(document))
+    
+    def parse_resume(self, text, name=None, features=None):
         """Main method to parse complete resume from text"""
+        key = self._parse_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if features is None:
+            features = self.extract_features(text)
+        text = features.document
+        if name is None:
+            name = self.extract_name(text)
+        
+        details, total_months = self._experience(text)
         
         parsed_data = {
             'contact_info': {
-                'name': self.extract_name(text),
-                'email': self.extract_email(text),
-                'phone': self.extract_phone(text),
+                'name': name,
+                'email': features.email,
+                'phone': features.phone,
                 'links': self.extract_links(text)
             },
             'education': self.extract_education(text),
             'skills': self.extract_skills(text),
             'experience': {
-                'details': self.extract_experience(text),
-                'total_years': self.calculate_experience_years(text)
+                'details': details,
+                'total_years': round(total_months / 12, 1),
+                'total_months': total_months
             },
             'raw_text': text[:500] + "..." if len(text) > 500 else text  # First 500 chars
         }
         
-        return parsed_data
\ No newline at end of file
+        self.cache.set(key, parsed_data)
+        return parsed_data
+    
+    def _parse_key(self, text):
+        """Cache key for the parse result of a text"""
+        # Experience months run to the current month for "Present" roles, so results expire monthly
+        return self.cache.key('parsed', self.PARSER_VERSION, date.today().strftime('%Y-%m'), text.encode('utf-8'))
+    
+    def parse_many(self, files_or_texts, n_process=1, batch_size=32, return_text=False):
+        """
+        Parse a batch of resumes, yielding parsed dicts in input order
+        files_or_texts: raw text strings, file paths (os.PathLike) or uploaded file objects
+        With n_process > 1, PDF and DOCX files whose text is not cached yet are
+        extracted on up to n_process spawned worker processes (forking a threaded
+        server could copy held locks and open cache connections), but only when
+        there are at least PARALLEL_MIN_FILES of them. Name NER runs through
+        nlp.pipe in batches of batch_size. Items with no extractable text yield None.
+        With return_text=True, (text, parsed_data) pairs are yielded instead.
+        """
+        payloads = (_to_payload(item) for item in files_or_texts)
+        
+        if n_process > 1:
+            texts = self._extract_parallel(list(payloads), n_process, batch_size)
+        else:
+            texts = map(partial(_extract_payload, parser=self), payloads)
+        yield from self._parse_batches(texts, batch_size, return_text)
+    
+    def _extract_parallel(self, payloads, n_process, batch_size):
+        """Yield the extracted text of each payload in order; cache misses go to a worker pool and are cached here"""
+        keys = [self._payload_key(payload) for payload in payloads]
+        texts = [payload[1] if payload[0] == 'text' else self.cache.get(key) if key else None
+                 for payload, key in zip(payloads, keys)]
+        # Plain text decodes in microseconds, so only uncached PDF and DOCX files are worth a worker
+        pooled = [i for i, (payload, text) in enumerate(zip(payloads, texts))
+                  if payload[0] != 'text' and text is None and not payload[1].lower().endswith('.txt')]
+        if len(pooled) < self.PARALLEL_MIN_FILES:
+            pooled = []
+        
+        pool = None
+        extracted = iter(())
+        if pooled:
+            n_workers = min(n_process, len(pooled))
+            pool = ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context('spawn'))
+            extracted = pool.map(_extract_payload, [payloads[i] for i in pooled],
+                                 chunksize=max(1, batch_size // n_workers))
+        try:
+            pooled = set(pooled)
+            for i, (payload, text) in enumerate(zip(payloads, texts)):
+                if i in pooled:
+                    text = next(extracted)
+                    if keys[i]:
+                        self.cache.set(keys[i], text)
+                elif text is None and payload[0] != 'text':
+                    text = _extract_payload(payload, parser=self)
+                yield text
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    
+    def _payload_key(self, payload):
+        """Text cache key of a file payload, None for raw text or an unreadable path"""
+        kind = payload[0]
+        if kind == 'text':
+            return None
+        if kind == 'upload':
+            return self._text_key(payload[1], payload[2])
+        try:
+            with open(payload[1], 'rb') as f:
+                return self._text_key(payload[1], f.read())
+        except OSError:
+            return None
+    
+    def _parse_batches(self, texts, batch_size, return_text):
+        """Run batched name NER and the regex extractors over extracted texts"""
+        while True:
+            batch = list(islice(texts, batch_size))
+            if not batch:
+                return
+            
+            cached = [self.cache.get(self._parse_key(text)) if text else None for text in batch]
+            
+            # Header windows of uncached resumes; names found by the fast path skip NER
+            headers = []
+            names = []
+            for text, hit in zip(batch, cached):
+                lines = self._header_lines(text) if text and hit is None else []
+                headers.append(lines)
+                names.append(self._name_fast_path(lines))
+            
+            # One nlp.pipe call covers every header that still needs NER
+            needs_ner = [bool(lines) and name is None for lines, name in zip(headers, names)]
+            docs = iter(self.nlp.pipe(
+                ['\n'.join(lines) for lines, needed in zip(headers, needs_ner) if needed],
+                batch_size=batch_size
+            ))
+            
+            for text, hit, lines, name, needed in zip(batch, cached, headers, names, needs_ner):
+                if needed:
+                    name = self._name_from_doc(lines, next(docs))
+                if not text:
+                    parsed = None
+                elif hit is not None:
+                    parsed = hit
+                else:
+                    parsed = self.parse_resume(text, name=name or self._name_from_doc(lines, None))
+                yield (text, parsed) if return_text else parsed
+
+
+def _to_payload(item):
+    """Turn a parse_many input into a picklable payload for the worker pool"""
+    if isinstance(item, str):
+        return ('text', item)
+    if isinstance(item, os.PathLike):
+        return ('path', os.fspath(item))
+    return ('upload', item.name, item.getvalue())
+
+
+def _extract_payload(payload, parser=None):
+    """
+    Extract text from one payload, None when nothing can be read
+    Worker processes pass no parser and extract without any cache, so they never
+    share the parent's cache lock or SQLite connection.
+    """
+    kind = payload[0]
+    if parser is None:
+        parser = ResumeParser(cache=ParseCache(max_items=0))
+    try:
+        if kind == 'text':
+            return payload[1]
+        if kind == 'path':
+            return parser.read_file(payload[1])
+        return parser.extract_text_from_bytes(payload[1], payload[2])
+    except (OSError, ValueError) as e:
+        print(f"Error extracting text: {e}")
+        return None
@@ -0,0 +1,121 @@
+import re
+
+from utils import patterns
+
+# Section name -> heading aliases recognised at the start of a line
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'career objective', 'about me'],
+    'education': ['education', 'academic', 'academics', 'qualification', 'qualifications',
+                  'educational background', 'academic background'],
+    'experience': ['experience', 'work experience', 'professional experience', 'work history',
+                   'employment', 'employment history', 'internships'],
+    'skills': ['skills', 'technical skills', 'key skills', 'core competencies'],
+    'projects': ['projects', 'academic projects', 'personal projects', 'key projects'],
+    'certifications': ['certifications', 'certification', 'certificates', 'licenses'],
+    'achievements': ['achievements', 'awards', 'honors', 'accomplishments'],
+    'publications': ['publications'],
+    'languages': ['languages'],
+    'interests': ['interests', 'hobbies'],
+}
+
+_ALIAS_TO_SECTION = {
+    alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases
+}
+_ALIASES = '|'.join(re.escape(alias) for alias in sorted(_ALIAS_TO_SECTION, key=len, reverse=True))
+
+# Nouns that make an unknown all-caps line a heading ("VOLUNTEER EXPERIENCE", "REFERENCES");
+# caps lines without one are names such as "ACME CORPORATION" and do not end a section
+HEADING_WORDS = [
+    'summary', 'profile', 'objective', 'education', 'academics', 'qualifications', 'experience',
+    'history', 'employment', 'internships', 'skills', 'competencies', 'projects', 'certifications',
+    'certificates', 'licenses', 'achievements', 'awards', 'honors', 'accomplishments', 'publications',
+    'languages', 'interests', 'hobbies', 'references', 'activities', 'volunteering', 'training',
+    'courses', 'coursework', 'declaration', 'details', 'affiliations', 'memberships', 'strengths'
+]
+_HEADING_WORDS = '|'.join(word.upper() for word in HEADING_WORDS)
+
+# Words joining the parts of a compound heading ("Education & Training", "PROJECTS AND AWARDS")
+_HEADING_WORD = r"[A-Z][A-Za-z-]*"
+_HEADING_JOIN = r"(?: ?[&/,] ?| (?i:and|of) | )"
+
+# One pattern for every kind of heading line in normalized text:
+#   a known heading alone on its line ("Education", "WORK EXPERIENCE:"),
+#   a known heading followed by inline content ("Skills: Python, SQL"),
+#   a short Title Case or all-caps line that may be a compound heading ("Relevant Experience",
+#   "SKILLS & TOOLS: Git"), checked by compound_sections,
+#   or any other all-caps line with a heading word, which only closes the previous section
+HEADING_PATTERN = re.compile(
+    rf'^(?:(?P<heading>(?i:{_ALIASES})) ?:?$'
+    rf'|(?P<inline>(?i:{_ALIASES})) ?: ?'
+    rf'|(?P<compound>{_HEADING_WORD}(?:{_HEADING_JOIN}{_HEADING_WORD}){{0,5}}) ?(?::?$|: )'
+    rf'|(?P<caps>(?=[A-Z &/]*\b(?:{_HEADING_WORDS})\b)[A-Z][A-Z &/]{{3,}}):?$)',
+    re.MULTILINE
+)
+CAPS_HEADING = re.compile(rf'(?=[A-Z &/]*\b(?:{_HEADING_WORDS})\b)[A-Z][A-Z &/]{{3,}}')
+_HEADING_PARTS = re.compile(r'\s*(?:[&/,]|\band\b)\s*', re.IGNORECASE)
+_ALIAS_AT_EDGE = re.compile(rf'^(?:{_ALIASES})\b|\b(?:{_ALIASES})$', re.IGNORECASE)
+
+
+def compound_sections(heading):
+    """
+    Sections named by a compound heading, in order: each part between "&", "/", ","
+    or "and" that starts or ends with a known heading ("Relevant Experience",
+    "Skills Summary") names its section. Job titles ("Customer Experience Manager",
+    "Skills Development Intern") name none.
+    """
+    if patterns.TITLE_KEYWORD.search(heading):
+        return ()
+    sections = []
+    for part in _HEADING_PARTS.split(heading):
+        match = _ALIAS_AT_EDGE.search(part)
+        if match:
+            section = _ALIAS_TO_SECTION[match.group().lower()]
+            if section not in sections:
+                sections.append(section)
+    return tuple(sections)
+
+
+class SectionIndex:
+    """Spans of every section in a resume, found in a single scan over the text"""
+
+    def __init__(self, text):
+        self.text = text
+        # (section names, heading start, content start) in document order; headings
+        # that name no section only close the previous one
+        self.headings = []
+        for match in HEADING_PATTERN.finditer(text):
+            alias = match.group('heading') or match.group('inline')
+            compound = match.group('compound')
+            if alias:
+                sections = (_ALIAS_TO_SECTION[alias.lower()],)
+            elif compound:
+                sections = compound_sections(compound)
+                # Names, companies and other capitalised lines are not headings at all;
+                # an unknown all-caps heading alone on its line still closes a section
+                if not sections and (match.group().endswith(': ') or not CAPS_HEADING.fullmatch(compound)):
+                    continue
+            else:
+                sections = ()
+            self.headings.append((sections, match.start(), match.end()))
+
+        # Each section runs until the next heading of any kind; the first occurrence wins
+        self.spans = {}
+        for i, (sections, _, content_start) in enumerate(self.headings):
+            end = self.headings[i + 1][1] if i + 1 < len(self.headings) else len(text)
+            for section in sections:
+                if section not in self.spans:
+                    self.spans[section] = (content_start, end)
+
+    def __contains__(self, section):
+        return section in self.spans
+
+    def span(self, section):
+        """(start, end) offsets of a section's content, or None"""
+        return self.spans.get(section)
+
+    def section_text(self, section):
+        """Content of a section without its heading, or None when it is missing or empty"""
+        span = self.spans.get(section)
+        if span is None:
+            return None
+        return self.text[span[0]:span[1]].strip() or None
@@ -0,0 +1,288 @@
+"""
+Local HTTP API over the resume analyzer (standard library only)
+
+    python -m utils.service [--host 127.0.0.1] [--port 8000]
+
+POST endpoints, each taking either a multipart/form-data upload (one or more
+resume files plus optional 'text', 'job_description' and 'top_k' fields) or a
+JSON body {"text": ...} / {"texts": [...]} with the same optional keys:
+
+    /parse    structured resume data
+    /score    ATS score, rating and feedback (job match included when a JD is given)
+    /match    job match percentage and missing keywords (needs job_description)
+    /predict  top job roles
+
+Responses are {"results": [...]}, one entry per resume in request order.
+GET /health reports readiness. Per-stage latency is returned in the
+Server-Timing header.
+"""
+import argparse
+import json
+import time
+from contextlib import contextmanager
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from utils.ats_scorer import ATSScorer
+from utils.job_predictor import get_default_predictor
+from utils.nlp_models import load_nlp
+from utils.resume_features import ResumeFeatures
+from utils.resume_parser import ResumeParser
+
+MAX_BODY_BYTES = 32 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """Client error reported with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class StageTimings:
+    """Wall-clock time per named stage of one request, rendered as Server-Timing"""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, (time.perf_counter() - started) * 1000))
+
+    def header(self):
+        return ', '.join(f"{name};dur={duration:.2f}" for name, duration in self.stages)
+
+
+class AnalyzerService:
+    """Parser, scorer and predictor kept warm and shared by every request thread"""
+
+    def __init__(self):
+        self.parser = ResumeParser()
+        self.scorer = ATSScorer()
+        self.predictor = get_default_predictor()
+
+    def warm(self):
+        """Load spaCy and fit the TF-IDF / role models before the first request"""
+        load_nlp()
+        self.predictor.predict_many(["warm up"])
+
+    def parse(self, resumes, request, timings):
+        with timings.stage('parse'):
+            parsed = self._parse_all(resumes)
+        return [dict(file=name, **data) for (name, _), data in zip(resumes, parsed)]
+
+    def score(self, resumes, request, timings):
+        job_description = request.get('job_description', "")
+        with timings.stage('features'):
+            features = [ResumeFeatures(text) for _, text in resumes]
+        with timings.stage('match'):
+            match_scores = self._match_all(resumes, job_description)
+        with timings.stage('score'):
+            results = []
+            for (name, _), feature, match_score in zip(resumes, features, match_scores):
+                ats = self.scorer.apply_job_match(self.scorer.score_base(feature), match_score)
+                results.append(dict(file=name, **ats))
+        return results
+
+    def match(self, resumes, request, timings):
+        job_description = request.get('job_description', "")
+        if not job_description:
+            raise RequestError(400, "job_description is required")
+        with timings.stage('match'):
+            match_scores = self._match_all(resumes, job_description)
+        with timings.stage('keywords'):
+            return [
+                {
+                    'file': name,
+                    'job_match': match_score,
+                    'missing_keywords': self.scorer.find_missing_keywords(text, job_description)
+                }
+                for (name, text), match_score in zip(resumes, match_scores)
+            ]
+
+    def predict(self, resumes, request, timings):
+        try:
+            top_k = int(request.get('top_k', 3))
+        except (TypeError, ValueError):
+            raise RequestError(400, "top_k must be an integer")
+        if top_k < 1:
+            raise RequestError(400, "top_k must be at least 1")
+        with timings.stage('predict'):
+            predictions = self.predictor.predict_many([text for _, text in resumes], top_k=top_k)
+        return [dict(file=name, **prediction) for (name, _), prediction in zip(resumes, predictions)]
+
+    def _parse_all(self, resumes):
+        # parse_many batches name NER through one nlp.pipe call
+        return list(self.parser.parse_many([text for _, text in resumes]))
+
+    def _match_all(self, resumes, job_description):
+        if not job_description:
+            return [None] * len(resumes)
+        return list(self.scorer.match_many([text for _, text in resumes], job_description))
+
+
+ROUTES = {
+    '/parse': AnalyzerService.parse,
+    '/score': AnalyzerService.score,
+    '/match': AnalyzerService.match,
+    '/predict': AnalyzerService.predict,
+}
+
+
+def parse_multipart(content_type, body):
+    """(form fields, [(file name, bytes)]) of a multipart/form-data body"""
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+    )
+    if not message.is_multipart():
+        raise RequestError(400, "Malformed multipart body")
+
+    fields = {}
+    files = []
+    for part in message.iter_parts():
+        payload = part.get_payload(decode=True) or b''
+        file_name = part.get_filename()
+        if file_name:
+            files.append((file_name, payload))
+        else:
+            name = part.get_param('name', header='content-disposition')
+            fields[name] = payload.decode(part.get_content_charset() or 'utf-8')
+    return fields, files
+
+
+def _json_default(value):
+    """Serialise numpy scalars and arrays returned by the models"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serialisable")
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """Routes requests to the shared AnalyzerService"""
+
+    service = None
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok', 'endpoints': sorted(ROUTES)})
+        else:
+            self._send(404, {'error': f"Unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        timings = StageTimings()
+        handler = ROUTES.get(self.path.split('?')[0])
+        if handler is None:
+            self._send(404, {'error': f"Unknown endpoint {self.path}"})
+            return
+
+        try:
+            with timings.stage('total'):
+                with timings.stage('read'):
+                    request, uploads = self._read_request()
+                with timings.stage('extract'):
+                    resumes = self._resumes(request, uploads)
+                results = handler(self.service, resumes, request, timings)
+            self._send(200, {'results': results}, timings)
+        except RequestError as e:
+            self._send(e.status, {'error': str(e)}, timings)
+        except Exception as e:
+            print(f"Error handling {self.path}: {e}")
+            self._send(500, {'error': str(e)}, timings)
+
+    def _read_request(self):
+        """(request fields, uploaded files) from a JSON or multipart body"""
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise RequestError(400, "Content-Length must be an integer")
+        if length < 0:
+            raise RequestError(400, "Content-Length must not be negative")
+        if length > MAX_BODY_BYTES:
+            raise RequestError(413, f"Request body larger than {MAX_BODY_BYTES} bytes")
+        body = self.rfile.read(length)
+
+        content_type = self.headers.get('Content-Type', '')
+        if content_type.startswith('multipart/form-data'):
+            return parse_multipart(content_type, body)
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            raise RequestError(400, "Body must be JSON or multipart/form-data")
+        if not isinstance(request, dict):
+            raise RequestError(400, "JSON body must be an object")
+        return request, []
+
+    def _resumes(self, request, uploads):
+        """(name, normalized text) of every resume in the request"""
+        resumes = []
+        for file_name, data in uploads:
+            try:
+                text = self.service.parser.extract_text_from_bytes(file_name, data)
+            except ValueError as e:
+                raise RequestError(400, f"{file_name}: {e}")
+            if not text:
+                raise RequestError(422, f"{file_name}: could not extract text")
+            resumes.append((file_name, text))
+
+        texts = request.get('texts') or []
+        if request.get('text'):
+            texts = [request['text']] + list(texts)
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise RequestError(400, "texts must be a list of strings")
+        for i, text in enumerate(texts):
+            if not text.strip():
+                raise RequestError(400, f"text[{i}] is empty")
+            resumes.append((f"text[{i}]", text))
+
+        if not resumes:
+            raise RequestError(400, "No resume given: upload a file or send text/texts")
+        return resumes
+
+    def _send(self, status, payload, timings=None):
+        body = json.dumps(payload, default=_json_default).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if timings is not None and timings.stages:
+            self.send_header('Server-Timing', timings.header())
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(host='127.0.0.1', port=8000, service=None):
+    """ThreadingHTTPServer bound to host:port, serving a warmed AnalyzerService"""
+    if service is None:
+        service = AnalyzerService()
+        service.warm()
+    handler = type('BoundServiceHandler', (ServiceHandler,), {'service': service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog='python -m utils.service', description="Resume analyzer HTTP API")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8000)
+    args = arg_parser.parse_args(argv)
+
+    server = create_server(args.host, args.port)
+    print(f"Resume analyzer API listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
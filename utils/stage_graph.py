@@ -0,0 +1,99 @@
+import threading
+
+# Marks a stage that has never been computed
+_MISSING = object()
+
+
+class _Node:
+    """One input or stage of a StageGraph"""
+
+    def __init__(self, name, func=None, deps=(), value=_MISSING):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.value = value
+        # Bumped whenever the value changes; dependants compare it to what they last saw
+        self.version = 0 if value is _MISSING else 1
+        self.dep_versions = None
+        self.lock = threading.RLock()
+
+
+class StageGraph:
+    """
+    Memoized DAG of named stages
+    Inputs are set with set(); stages are functions of other inputs or stages and
+    are computed lazily by get(). Each node remembers the versions of the
+    dependencies it was computed from, so changing an input only recomputes the
+    stages downstream of it. Every node has its own lock: concurrent get() calls
+    for the same stage compute it once, while independent stages run in parallel.
+    """
+
+    def __init__(self):
+        self._nodes = {}
+
+    def add_input(self, name, value=_MISSING):
+        """Declare an input node, optionally with its initial value"""
+        self._nodes[name] = _Node(name, value=value)
+        return self
+
+    def add_stage(self, name, func, deps):
+        """Declare a stage computed as func(*values of deps); deps must already exist"""
+        for dep in deps:
+            if dep not in self._nodes:
+                raise ValueError(f"Unknown dependency '{dep}' for stage '{name}'")
+        self._nodes[name] = _Node(name, func=func, deps=deps)
+        return self
+
+    def set(self, name, value):
+        """Change an input; setting the same value again invalidates nothing"""
+        node = self._nodes[name]
+        if node.func is not None:
+            raise ValueError(f"'{name}' is a stage, not an input")
+        with node.lock:
+            if node.value is not _MISSING and node.value == value:
+                return
+            node.value = value
+            node.version += 1
+
+    def get(self, name):
+        """Value of a node, computing it and any stale dependencies first"""
+        return self._evaluate(name)[0]
+
+    def peek(self, name, default=None):
+        """Value of a node if it is up to date, without computing anything"""
+        node = self._nodes[name]
+        return node.value if self.is_current(name) else default
+
+    def is_current(self, name):
+        """True when a node has a value computed from the current versions of its dependencies"""
+        node = self._nodes[name]
+        if node.value is _MISSING:
+            return False
+        if node.func is None:
+            return True
+        if not all(self.is_current(dep) for dep in node.deps):
+            return False
+        return node.dep_versions == tuple(self._nodes[dep].version for dep in node.deps)
+
+    def _evaluate(self, name):
+        """(value, version) of a node, recomputing it if a dependency changed"""
+        node = self._nodes[name]
+        with node.lock:
+            if node.func is None:
+                if node.value is _MISSING:
+                    raise ValueError(f"Input '{name}' has not been set")
+                return node.value, node.version
+
+            values = []
+            versions = []
+            for dep in node.deps:
+                value, version = self._evaluate(dep)
+                values.append(value)
+                versions.append(version)
+
+            versions = tuple(versions)
+            if node.value is _MISSING or node.dep_versions != versions:
+                node.value = node.func(*values)
+                node.dep_versions = versions
+                node.version += 1
+            return node.value, node.version
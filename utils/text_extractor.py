@@ -1,18 +1,56 @@
 import pdfplumber
 from docx import Document
-import re
+import time
+from utils.text_normalizer import normalize
+
+
+def iter_pdf_pages(source, max_pages=None, max_bytes=None, timeout=None):
+    """
+    Yield the text of each PDF page lazily, stopping once a budget is spent
+    source: file path or binary stream
+    max_pages / max_bytes (UTF-8 text) / timeout (seconds, checked between pages)
+    """
+    started = time.monotonic()
+    used_bytes = 0
+    
+    with pdfplumber.open(source) as pdf:
+        for page_number, page in enumerate(pdf.pages):
+            if max_pages is not None and page_number >= max_pages:
+                print(f"PDF truncated: page limit of {max_pages} reached")
+                return
+            if timeout is not None and time.monotonic() - started > timeout:
+                print(f"PDF truncated: {timeout}s time limit reached after {page_number} pages")
+                return
+            
+            page_text = page.extract_text()
+            if not page_text:
+                continue
+            
+            if max_bytes is not None:
+                encoded = page_text.encode('utf-8')
+                if used_bytes + len(encoded) > max_bytes:
+                    remaining = encoded[:max_bytes - used_bytes]
+                    yield remaining.decode('utf-8', errors='ignore')
+                    print(f"PDF truncated: {max_bytes} byte text limit reached")
+                    return
+                used_bytes += len(encoded)
+            
+            yield page_text
+
 
 class TextExtractor:
     """Extract text from PDF and DOCX files"""
     
+    # Per-document budgets so an oversized upload cannot stall a worker
+    MAX_PDF_PAGES = 20
+    MAX_PDF_BYTES = 200_000
+    PDF_TIMEOUT = 15
+    
     def extract_from_pdf(self, file_path):
         """Extract text from PDF file"""
-        text = ""
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
-            return text
+            pages = iter_pdf_pages(file_path, self.MAX_PDF_PAGES, self.MAX_PDF_BYTES, self.PDF_TIMEOUT)
+            return "\n".join(pages) + "\n"
         except Exception as e:
             print(f"Error reading PDF: {e}")
             return None
@@ -38,12 +76,5 @@ class TextExtractor:
             return None
     
     def clean_text(self, text):
-        """Clean extracted text"""
-        if not text:
-            return ""
-        
-        # Remove extra whitespaces
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep essential punctuation
-        text = re.sub(r'[^\w\s@.,()-]', '', text)
-        return text.strip()
+        """Clean extracted text into the shared line-preserving ResumeDocument"""
+        return normalize(text)
@@ -0,0 +1,97 @@
+import re
+from bisect import bisect_right
+from utils.section_index import SectionIndex
+
+# Everything except word characters, whitespace and the punctuation resumes rely on
+# (emails, URLs, dates, phone numbers, C++/C#, percentages, bullets)
+_DISALLOWED = re.compile(r"[^\w\s@.,:()\-/+#%&'•]")
+# En and em dashes separate date ranges ("Jan 2020 – Present"), so they become hyphens
+_DASHES = re.compile(r'[\u2013\u2014]')
+_HORIZONTAL_SPACE = re.compile(r'[^\S\n]+')
+
+
+class ResumeDocument(str):
+    """
+    Normalized resume text shared by the parser, scorer and extractors
+    The string value is the canonical text: one line per non-empty source line with
+    single spaces. flat_lower is the same text lowercased with newlines as spaces.
+    Build instances with normalize(); they are immutable.
+    """
+
+    __slots__ = ('flat_lower', 'lines', 'line_starts', '_flat_offsets', '_sections')
+
+    def __new__(cls, canonical):
+        document = super().__new__(cls, canonical)
+        lower = canonical.lower()
+        lines = tuple(canonical.split('\n')) if canonical else ()
+
+        line_starts = []
+        offset = 0
+        for line in lines:
+            line_starts.append(offset)
+            offset += len(line) + 1
+
+        # Lowercasing keeps offsets aligned except for a few characters ('İ' -> 'i̇');
+        # only then is an explicit canonical -> flat offset table needed
+        flat_offsets = None
+        if len(lower) != len(canonical):
+            flat_offsets = [0]
+            for char in canonical:
+                flat_offsets.append(flat_offsets[-1] + len(char.lower()))
+
+        object.__setattr__(document, 'flat_lower', lower.replace('\n', ' '))
+        object.__setattr__(document, 'lines', lines)
+        object.__setattr__(document, 'line_starts', line_starts)
+        object.__setattr__(document, '_flat_offsets', flat_offsets)
+        object.__setattr__(document, '_sections', None)
+        return document
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResumeDocument is immutable")
+
+    def __reduce__(self):
+        # Rebuild from the canonical text when pickled to worker processes
+        return (ResumeDocument, (str(self),))
+
+    @property
+    def text(self):
+        """Canonical text as a plain string"""
+        return str(self)
+
+    @property
+    def sections(self):
+        """SectionIndex of this document, built on first use"""
+        if self._sections is None:
+            object.__setattr__(self, '_sections', SectionIndex(self))
+        return self._sections
+
+    def to_flat(self, offset):
+        """Map an offset in the canonical text to the matching offset in flat_lower"""
+        if self._flat_offsets is None:
+            return offset
+        return self._flat_offsets[offset]
+
+    def to_text(self, flat_offset):
+        """Map an offset in flat_lower back to the canonical text"""
+        if self._flat_offsets is None:
+            return flat_offset
+        return bisect_right(self._flat_offsets, flat_offset) - 1
+
+    def line_at(self, offset):
+        """Index of the line containing a canonical text offset"""
+        return bisect_right(self.line_starts, offset) - 1
+
+
+def normalize(text):
+    """Clean raw extracted text into a ResumeDocument (documents pass through untouched)"""
+    if isinstance(text, ResumeDocument):
+        return text
+    if not text:
+        return ResumeDocument('')
+
+    # Replace special characters with spaces so neighbouring words stay apart
+    text = _DASHES.sub('-', text)
+    text = _DISALLOWED.sub(' ', text)
+    # Collapse whitespace within each line and drop blank lines
+    text = _HORIZONTAL_SPACE.sub(' ', text)
+    return ResumeDocument('\n'.join(line.strip() for line in text.split('\n') if line.strip()))